@@ -1,7 +1,13 @@
+import io
+import json
 from datetime import date, time
+from pathlib import Path
 
 import streamlit as st
 
+from pawpal_analytics import GROUPS, TaskTable
+from pawpal_store import OwnerStore
+from pawpal_sweep import MAX_BUDGET, sweep_budgets
 from pawpal_system import Owner, Pet, Scheduler, Task
 
 DATA_FILE = "data.json"
@@ -11,20 +17,18 @@ st.title("🐾 PawPal+")
 st.caption("Pet care planner")
 
 
-if "owners" not in st.session_state:
-    loaded_owners = Owner.load_from_json(DATA_FILE)
-    st.session_state.owners = {}
-    for owner in loaded_owners:
-        st.session_state.owners[owner.name] = {
-            "daily_time_available": owner.daily_time_available,
-            "pets": {pet.name: pet for pet in owner.pets},
-        }
+# Only the owner list is read at startup; an owner's pets and tasks are
+# loaded when that owner becomes active (see OwnerStore).
+if "store" not in st.session_state:
+    st.session_state.store = OwnerStore(DATA_FILE)
+store = st.session_state.store
 if "active_owner" not in st.session_state:
-    st.session_state.active_owner = (
-        next(iter(st.session_state.owners)) if st.session_state.owners else None
-    )
+    st.session_state.active_owner = store.names()[0] if len(store) else None
 if "scheduler" not in st.session_state:
     st.session_state.scheduler = Scheduler()
+# bumped on every save, so cached derived views know when they are stale
+if "data_version" not in st.session_state:
+    st.session_state.data_version = 0
 
 
 def to_minutes(t: time) -> int:
@@ -46,25 +50,45 @@ def format_priority(priority: str) -> str:
     return "🟢 Low"
 
 
-def get_active_owner_record():
+def get_active_owner():
     owner_name = st.session_state.active_owner
     if not owner_name:
         return None
-    return st.session_state.owners.get(owner_name)
+    return store.get(owner_name)
 
 
-def build_owner_model(owner_name: str, owner_record: dict) -> Owner:
-    owner = Owner(owner_name, int(owner_record["daily_time_available"]))
-    for pet in owner_record["pets"].values():
-        owner.add_pet(pet)
-    return owner
+def find_pet(owner: Owner, pet_name: str):
+    for pet in owner.pets:
+        if pet.name == pet_name:
+            return pet
+    return None
 
 
 def save_app_state() -> None:
-    owners_to_save = []
-    for owner_name, owner_record in st.session_state.owners.items():
-        owners_to_save.append(build_owner_model(owner_name, owner_record))
-    Owner.save_to_json(owners_to_save, DATA_FILE)
+    store.save()
+    st.session_state.data_version += 1
+
+
+def cached_sweep(owner: Owner):
+    """
+    The owner's budget sweep, recomputed only after a save changed the data.
+    """
+    key = (owner.name, st.session_state.data_version)
+    cached = st.session_state.get("sweep_cache")
+    if cached is None or cached[0] != key:
+        cached = st.session_state.sweep_cache = (key, sweep_budgets(owner))
+    return cached[1]
+
+
+def cached_task_table() -> TaskTable:
+    """
+    Every owner's tasks as columns, rebuilt only after a save changed the data.
+    """
+    cached = st.session_state.get("task_table_cache")
+    if cached is None or cached[0] != st.session_state.data_version:
+        cached = (st.session_state.data_version, TaskTable.from_owners(store.all()))
+        st.session_state.task_table_cache = cached
+    return cached[1]
 
 
 st.subheader("Owners")
@@ -86,52 +110,51 @@ with owner_col3:
         cleaned_owner = new_owner_name.strip()
         if not cleaned_owner:
             st.error("Owner name is required.")
-        elif cleaned_owner in st.session_state.owners:
+        elif cleaned_owner in store:
             st.warning(f"Owner '{cleaned_owner}' already exists.")
         else:
-            st.session_state.owners[cleaned_owner] = {
-                "daily_time_available": int(new_owner_daily_time),
-                "pets": {},
-            }
+            store.add(Owner(cleaned_owner, int(new_owner_daily_time)))
             st.session_state.active_owner = cleaned_owner
             save_app_state()
             st.success(f"Added owner '{cleaned_owner}'.")
 
-if st.session_state.owners:
-    st.write("Current owners:")
-    st.table(
-        [
-            {
-                "owner": name,
-                "daily_time_available": data["daily_time_available"],
-                "pets": len(data["pets"]),
-            }
-            for name, data in st.session_state.owners.items()
-        ]
-    )
+if len(store):
+    if st.toggle("Show all owners", key="show_owners"):
+        st.write("Current owners:")
+        st.table(
+            [
+                {
+                    "owner": name,
+                    "daily_time_available": store.summary(name)[0],
+                    "pets": store.summary(name)[1],
+                }
+                for name in store.names()
+            ]
+        )
 
+    owner_names = store.names()
     st.session_state.active_owner = st.selectbox(
         "Active owner",
-        options=list(st.session_state.owners.keys()),
+        options=owner_names,
         index=(
-            list(st.session_state.owners.keys()).index(st.session_state.active_owner)
-            if st.session_state.active_owner in st.session_state.owners
+            owner_names.index(st.session_state.active_owner)
+            if st.session_state.active_owner in store
             else 0
         ),
         key="active_owner_select",
     )
 
-    active_record = get_active_owner_record()
-    if active_record is not None:
+    active_owner = get_active_owner()
+    if active_owner is not None:
         updated_daily_time = st.number_input(
             "Update active owner daily minutes",
             min_value=0,
             max_value=1440,
-            value=int(active_record["daily_time_available"]),
+            value=int(active_owner.daily_time_available),
             key="active_owner_daily_minutes",
         )
         if st.button("Save owner settings"):
-            active_record["daily_time_available"] = int(updated_daily_time)
+            active_owner.set_daily_time_available(int(updated_daily_time))
             save_app_state()
             st.success(f"Updated settings for '{st.session_state.active_owner}'.")
 else:
@@ -139,9 +162,9 @@ else:
 
 st.divider()
 
-active_record = get_active_owner_record()
+active_owner = get_active_owner()
 st.subheader("Pets")
-if active_record is None:
+if active_owner is None:
     st.caption("Add and select an owner first.")
 else:
     pet_col1, pet_col2, pet_col3 = st.columns([2, 2, 1])
@@ -158,23 +181,23 @@ else:
             cleaned_pet = new_pet_name.strip()
             if not cleaned_pet:
                 st.error("Pet name is required.")
-            elif cleaned_pet in active_record["pets"]:
+            elif find_pet(active_owner, cleaned_pet) is not None:
                 st.warning(
                     f"Pet '{cleaned_pet}' already exists for owner '{st.session_state.active_owner}'."
                 )
             else:
-                active_record["pets"][cleaned_pet] = Pet(cleaned_pet, new_pet_species)
+                active_owner.add_pet(Pet(cleaned_pet, new_pet_species))
                 save_app_state()
                 st.success(
                     f"Added pet '{cleaned_pet}' to owner '{st.session_state.active_owner}'."
                 )
 
-    if active_record["pets"]:
+    if active_owner.pets:
         st.write(f"Current pets for {st.session_state.active_owner}:")
         st.table(
             [
                 {"name": p.name, "species": p.species}
-                for p in active_record["pets"].values()
+                for p in active_owner.pets
             ]
         )
     else:
@@ -183,12 +206,12 @@ else:
 st.divider()
 
 st.subheader("Tasks")
-if active_record is None or not active_record["pets"]:
+if active_owner is None or not active_owner.pets:
     st.caption("Select an owner with at least one pet first.")
 else:
     t_col1, t_col2 = st.columns(2)
     with t_col1:
-        task_pet = st.selectbox("Pet", list(active_record["pets"].keys()), key="task_pet")
+        task_pet = st.selectbox("Pet", [p.name for p in active_owner.pets], key="task_pet")
         task_title = st.text_input(
             "Task description", value="Morning walk", key="task_description"
         )
@@ -225,42 +248,58 @@ else:
                 completed=completed,
                 due_date=due,
             )
-            active_record["pets"][task_pet].add_task(task)
+            find_pet(active_owner, task_pet).add_task(task)
             save_app_state()
             st.success(
                 f"Added task #{task.number} for {task_pet} (owner: {st.session_state.active_owner})."
             )
 
-    all_tasks = []
-    for pet in active_record["pets"].values():
-        for t in pet.get_tasks():
-            all_tasks.append(
-                {
-                    "#": t.number,
-                    "pet": t.pet_name,
-                    "description": t.description,
-                    "duration": t.duration_minutes,
-                    "priority": format_priority(t.priority),
-                    "time": to_hhmm(t.time),
-                    "frequency": t.frequency,
-                    "due_date": t.due_date.isoformat(),
-                    "completed": t.completed,
-                }
-            )
+    uploaded = st.file_uploader(
+        "Bulk import tasks (CSV or NDJSON)", type=["csv", "ndjson", "jsonl"], key="task_import"
+    )
+    if uploaded is not None and st.button("Import tasks"):
+        fmt = "csv" if Path(uploaded.name).suffix.lower() == ".csv" else "ndjson"
+        report = active_owner.import_tasks(
+            io.StringIO(uploaded.getvalue().decode("utf-8")), fmt=fmt, create_pets=True
+        )
+        if report.imported:
+            save_app_state()
+        st.success(f"Imported {report.imported} tasks.")
+        if report.errors:
+            st.warning(f"{len(report.errors)} rows were skipped:")
+            st.table([{"row": e.row, "error": e.message} for e in report.errors[:50]])
+
+    if st.toggle("Show tasks", key="show_tasks"):
+        all_tasks = []
+        for pet in active_owner.pets:
+            for t in pet.get_tasks():
+                all_tasks.append(
+                    {
+                        "#": t.number,
+                        "pet": t.pet_name,
+                        "description": t.description,
+                        "duration": t.duration_minutes,
+                        "priority": format_priority(t.priority),
+                        "time": to_hhmm(t.time),
+                        "frequency": t.frequency,
+                        "due_date": t.due_date.isoformat(),
+                        "completed": t.completed,
+                    }
+                )
 
-    if all_tasks:
-        st.write(f"Current tasks for {st.session_state.active_owner}:")
-        st.table(all_tasks)
-    else:
-        st.info("No tasks yet for this owner.")
+        if all_tasks:
+            st.write(f"Current tasks for {st.session_state.active_owner}:")
+            st.table(all_tasks)
+        else:
+            st.info("No tasks yet for this owner.")
 
 st.divider()
 
 st.subheader("Scheduler")
-if active_record is None:
+if active_owner is None:
     st.caption("Select an owner first.")
 elif st.button("Generate schedule"):
-    owner = build_owner_model(st.session_state.active_owner, active_record)
+    owner = active_owner
     scheduler = st.session_state.scheduler
     plan, explanation = scheduler.generate_plan(owner)
 
@@ -300,13 +339,33 @@ elif st.button("Generate schedule"):
     st.write(f"Incomplete tasks: {len(incomplete)}")
     st.write(f"Completed tasks: {len(complete)}")
 
+if active_owner is not None and st.toggle("What if?", key="show_what_if"):
+    # the sweep covers every slider position and is kept across reruns,
+    # so moving the slider is just a lookup
+    sweep = cached_sweep(active_owner)
+    what_if_minutes = st.slider(
+        "Daily minutes",
+        min_value=0,
+        max_value=MAX_BUDGET,
+        value=int(active_owner.daily_time_available),
+        step=5,
+        key="what_if_minutes",
+    )
+    outcome = sweep.at(what_if_minutes)
+    st.write(
+        f"{outcome.scheduled} of {len(sweep.tasks)} open tasks scheduled, "
+        f"{outcome.minutes_used} of {what_if_minutes} minutes used."
+    )
+    if outcome.marginal_task is not None:
+        st.caption(f"Next task that would fit with more time: #{outcome.marginal_task}")
+
 st.divider()
 
 st.subheader("Mark Task Complete")
-if active_record is None:
+if active_owner is None:
     st.caption("Select an owner first.")
-else:
-    owner_for_completion = build_owner_model(st.session_state.active_owner, active_record)
+elif st.toggle("Show completion picker", key="show_completion"):
+    owner_for_completion = active_owner
     tasks_for_picker = sorted(owner_for_completion.get_all_tasks(), key=lambda t: t.number)
 
     if tasks_for_picker:
@@ -331,3 +390,58 @@ else:
                 st.error("Task not found.")
     else:
         st.caption("No tasks available for this owner.")
+
+st.divider()
+
+st.subheader("Workload Dashboard")
+if not len(store):
+    st.caption("Add an owner first.")
+elif st.toggle("Show dashboard (loads every owner)", key="show_dashboard"):
+    table = cached_task_table()
+    dash_col1, dash_col2, dash_col3 = st.columns(3)
+    with dash_col1:
+        group_by = st.selectbox("Group by", list(GROUPS), index=1, key="dashboard_group")
+    with dash_col2:
+        range_start = st.date_input("Due from", value=None, key="dashboard_start")
+    with dash_col3:
+        range_end = st.date_input("Due to", value=None, key="dashboard_end")
+
+    minutes = table.minutes_by(group_by, range_start, range_end)
+    counts = table.counts_by(group_by, range_start, range_end)
+    rates = table.completion_rate_by(group_by, range_start, range_end)
+    if not minutes:
+        st.info("No tasks in this range.")
+    else:
+        st.table(
+            [
+                {
+                    group_by: label,
+                    "tasks": counts[label],
+                    "minutes": minutes[label],
+                    "completed": f"{rates[label]:.0%}",
+                }
+                for label in minutes
+            ]
+        )
+        st.markdown("### Start times by hour")
+        st.bar_chart({"tasks": table.start_time_histogram(60, range_start, range_end).tolist()})
+
+st.divider()
+
+st.subheader("Sync")
+feed = store.feed
+st.caption(f"Data version {feed.version} (feed {feed.epoch[:8]})")
+if st.toggle("Export changes for a replica", key="show_sync"):
+    since_version = st.number_input(
+        "Replica is at version", min_value=0, max_value=feed.version, value=0, key="sync_since"
+    )
+    since_epoch = st.text_input("Replica's feed id (blank if unknown)", key="sync_epoch").strip()
+    delta = feed.delta_since(int(since_version), since_epoch or None)
+    if delta["checkpoint"] is not None:
+        st.caption("The replica is too far behind or on another feed; the export includes a checkpoint.")
+    st.download_button(
+        f"Download {len(delta['changes'])} changes",
+        data=json.dumps(delta, indent=2),
+        file_name=f"delta-{delta['from']}-{delta['to']}.json",
+        mime="application/json",
+    )
@@ -0,0 +1,191 @@
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from pawpal_system import Owner
+
+# -------------------------
+# Workload analytics
+# -------------------------
+
+GROUPS = ("owner", "pet", "species", "priority", "frequency")
+_PRIORITY_LABELS = ["low", "medium", "high"]  # code = priority_rank - 1
+
+
+class TaskTable:
+    """
+    Tasks of many owners copied once into NumPy columns.
+    Every aggregate is a masked np.bincount over small integer group codes,
+    so questions about millions of tasks never loop in Python.
+
+    Pets are grouped per owner ("Luna (Amelia)") since names repeat across owners.
+    Date filters (start/end) are inclusive and apply to due_date.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], labels: Dict[str, List[str]]) -> None:
+        self.columns = columns
+        self.labels = labels
+
+    @classmethod
+    def from_owners(cls, owners: List[Owner]) -> "TaskTable":
+        labels: Dict[str, List[str]] = {"priority": list(_PRIORITY_LABELS)}
+        codes: Dict[str, Dict[str, int]] = {
+            group: {} for group in ("owner", "pet", "species", "frequency")
+        }
+
+        def code(group: str, label: str) -> int:
+            table = codes[group]
+            value = table.get(label)
+            if value is None:
+                value = table[label] = len(table)
+            return value
+
+        rows: Dict[str, list] = {
+            name: []
+            for name in ("owner", "pet", "species", "priority", "frequency",
+                         "duration", "time", "due", "completed")
+        }
+        seen = set()  # pets shared between owners count once, for the first owner
+        for owner in owners:
+            owner_code = code("owner", owner.name)
+            for pet in owner.pets:
+                pet_code = code("pet", f"{pet.name} ({owner.name})")
+                species_code = code("species", pet.species)
+                for task in pet.tasks:
+                    if id(task) in seen:
+                        continue
+                    seen.add(id(task))
+                    rows["owner"].append(owner_code)
+                    rows["pet"].append(pet_code)
+                    rows["species"].append(species_code)
+                    rows["priority"].append(task.priority_rank - 1)
+                    rows["frequency"].append(code("frequency", task.frequency))
+                    rows["duration"].append(task.duration_minutes)
+                    rows["time"].append(task.time)
+                    rows["due"].append(task.due_date.toordinal())
+                    rows["completed"].append(task.completed)
+
+        columns = {
+            name: np.asarray(values, dtype=np.bool_ if name == "completed" else np.int64)
+            for name, values in rows.items()
+        }
+        for group, table in codes.items():
+            labels[group] = list(table)
+        return cls(columns, labels)
+
+    def __len__(self) -> int:
+        return len(self.columns["duration"])
+
+    def _mask(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        completed: Optional[bool] = None,
+    ) -> np.ndarray:
+        mask = np.ones(len(self), dtype=np.bool_)
+        if start is not None:
+            mask &= self.columns["due"] >= start.toordinal()
+        if end is not None:
+            mask &= self.columns["due"] <= end.toordinal()
+        if completed is not None:
+            mask &= self.columns["completed"] == completed
+        return mask
+
+    @staticmethod
+    def _check_group(by: str) -> None:
+        if by not in GROUPS:
+            raise ValueError(f"Unknown group {by!r}; expected one of {', '.join(GROUPS)}")
+
+    def _grouped(
+        self, by: str, mask: np.ndarray, weights: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        self._check_group(by)
+        return np.bincount(
+            self.columns[by][mask],
+            weights=None if weights is None else weights[mask],
+            minlength=len(self.labels[by]),
+        )
+
+    def counts_by(
+        self,
+        by: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        completed: Optional[bool] = None,
+    ) -> Dict[str, int]:
+        counts = self._grouped(by, self._mask(start, end, completed))
+        return {label: int(n) for label, n in zip(self.labels[by], counts) if n}
+
+    def minutes_by(
+        self,
+        by: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        completed: Optional[bool] = None,
+    ) -> Dict[str, int]:
+        mask = self._mask(start, end, completed)
+        counts = self._grouped(by, mask)
+        minutes = self._grouped(by, mask, self.columns["duration"])
+        return {
+            label: int(total)
+            for label, n, total in zip(self.labels[by], counts, minutes)
+            if n
+        }
+
+    def completion_rate_by(
+        self, by: str, start: Optional[date] = None, end: Optional[date] = None
+    ) -> Dict[str, float]:
+        mask = self._mask(start, end)
+        counts = self._grouped(by, mask)
+        done = self._grouped(by, mask & self.columns["completed"])
+        return {
+            label: float(d / n)
+            for label, n, d in zip(self.labels[by], counts, done)
+            if n
+        }
+
+    def weekly_minutes_by(
+        self,
+        by: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        completed: Optional[bool] = None,
+    ) -> Dict[Tuple[str, date], int]:
+        """
+        Minutes per (group label, Monday of the due_date's week).
+        """
+        self._check_group(by)
+        mask = self._mask(start, end, completed)
+        if not mask.any():
+            return {}
+        # ordinal 1 (0001-01-01) is a Monday, so weeks start on Mondays
+        weeks = (self.columns["due"][mask] - 1) // 7
+        first_week = int(weeks.min())
+        week_count = int(weeks.max()) - first_week + 1
+        keys = self.columns[by][mask] * week_count + (weeks - first_week)
+        size = len(self.labels[by]) * week_count
+        counts = np.bincount(keys, minlength=size)
+        minutes = np.bincount(keys, weights=self.columns["duration"][mask], minlength=size)
+
+        result: Dict[Tuple[str, date], int] = {}
+        for key in np.flatnonzero(counts):
+            group, week = divmod(int(key), week_count)
+            monday = date.fromordinal((first_week + week) * 7 + 1)
+            result[(self.labels[by][group], monday)] = int(minutes[key])
+        return result
+
+    def start_time_histogram(
+        self,
+        bin_minutes: int = 60,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        completed: Optional[bool] = None,
+    ) -> np.ndarray:
+        """
+        Task counts by start time; bin i covers minutes [i*bin_minutes, (i+1)*bin_minutes).
+        """
+        bins = -(-24 * 60 // bin_minutes)
+        mask = self._mask(start, end, completed)
+        return np.bincount(self.columns["time"][mask] // bin_minutes, minlength=bins)[:bins]
+
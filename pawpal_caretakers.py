@@ -0,0 +1,224 @@
+import heapq
+import time as clock
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from pawpal_system import Owner, Task
+
+# -------------------------
+# Multi-caretaker assignment
+# -------------------------
+
+
+@dataclass
+class Caretaker:
+    name: str
+    daily_time_available: int  # minutes
+    window_start: int = 0  # minutes since midnight
+    window_end: int = 24 * 60
+
+    @classmethod
+    def from_owner(
+        cls, owner: Owner, window_start: int = 0, window_end: int = 24 * 60
+    ) -> "Caretaker":
+        return cls(owner.name, owner.daily_time_available, window_start, window_end)
+
+
+@dataclass
+class Assignment:
+    tasks_by_caretaker: Dict[str, List[Task]]
+    minutes_used: Dict[str, int]
+    unassigned: List[Task] = field(default_factory=list)
+
+    def utilization(self, caretakers: List[Caretaker]) -> Dict[str, float]:
+        return {
+            c.name: self.minutes_used[c.name] / c.daily_time_available
+            if c.daily_time_available
+            else 0.0
+            for c in caretakers
+        }
+
+
+class _Load:
+    """
+    One caretaker's running state: minutes used and the booked intervals,
+    kept sorted by start time so overlap checks are a bisect.
+    """
+
+    def __init__(self, caretaker: Caretaker) -> None:
+        self.caretaker = caretaker
+        self.used = 0
+        self.starts: List[int] = []
+        self.tasks: List[Task] = []  # parallel to starts
+
+    @property
+    def remaining(self) -> int:
+        return self.caretaker.daily_time_available - self.used
+
+    @property
+    def utilization(self) -> float:
+        budget = self.caretaker.daily_time_available
+        return self.used / budget if budget else float("inf")
+
+    def utilization_with(self, minutes: int) -> float:
+        budget = self.caretaker.daily_time_available
+        return (self.used + minutes) / budget if budget else float("inf")
+
+    def can_take(self, task: Task) -> bool:
+        c = self.caretaker
+        start, end = task.time, task.time + task.duration_minutes
+        if task.duration_minutes > self.remaining:
+            return False
+        if start < c.window_start or end > c.window_end:
+            return False
+        # same overlap rule as Scheduler.detect_conflicts: next start < current end
+        i = bisect_right(self.starts, start)
+        if i > 0:
+            prev = self.tasks[i - 1]
+            if start < prev.time + prev.duration_minutes:
+                return False
+        if i < len(self.starts) and self.starts[i] < end:
+            return False
+        return True
+
+    def add(self, task: Task) -> None:
+        i = bisect_right(self.starts, task.time)
+        self.starts.insert(i, task.time)
+        self.tasks.insert(i, task)
+        self.used += task.duration_minutes
+
+    def remove(self, task: Task) -> None:
+        lo = bisect_left(self.starts, task.time)
+        hi = bisect_right(self.starts, task.time)
+        for i in range(lo, hi):
+            if self.tasks[i] is task:
+                del self.starts[i]
+                del self.tasks[i]
+                self.used -= task.duration_minutes
+                return
+        raise ValueError(f"Task #{task.number} is not assigned to {self.caretaker.name}")
+
+
+def pool_tasks(owners: List[Owner]) -> List[Task]:
+    """
+    Collects the incomplete tasks of several owners. Pets shared between
+    owners contribute their tasks once.
+    """
+    seen = set()
+    pool: List[Task] = []
+    for owner in owners:
+        for task in owner.get_all_tasks():
+            if not task.completed and id(task) not in seen:
+                seen.add(id(task))
+                pool.append(task)
+    return pool
+
+
+class CaretakerScheduler:
+    def assign(
+        self,
+        tasks: List[Task],
+        caretakers: List[Caretaker],
+        time_limit: float = 1.0,
+    ) -> Assignment:
+        """
+        Assigns a pool of tasks across caretakers.
+        - Each caretaker stays within daily_time_available and their working window.
+        - No caretaker gets two overlapping tasks (by time/duration_minutes).
+        Greedy first (priority, then start time, each task to the least loaded
+        caretaker that can take it), then local search moves tasks off the most
+        loaded caretaker until nothing improves or time_limit seconds pass.
+        Caretaker names key the result, so they must be unique.
+        """
+        names = set()
+        for caretaker in caretakers:
+            if caretaker.name in names:
+                raise ValueError(f"Caretaker '{caretaker.name}' appears more than once")
+            names.add(caretaker.name)
+
+        deadline = clock.perf_counter() + time_limit
+        loads = [_Load(c) for c in caretakers]
+        pending = [t for t in tasks if not t.completed]
+        pending.sort(key=lambda t: (-t.priority_rank, t.time))
+
+        unassigned = self._greedy(pending, loads)
+        self._rebalance(loads, deadline)
+        if unassigned and clock.perf_counter() < deadline:
+            # rebalancing can free a slot that was taken during the greedy pass
+            unassigned = self._greedy(unassigned, loads)
+
+        return Assignment(
+            tasks_by_caretaker={load.caretaker.name: list(load.tasks) for load in loads},
+            minutes_used={load.caretaker.name: load.used for load in loads},
+            unassigned=unassigned,
+        )
+
+    def _greedy(self, tasks: List[Task], loads: List[_Load]) -> List[Task]:
+        # min-heap of (utilization, index); entries go stale when a load changes
+        heap = [
+            (load.utilization, i)
+            for i, load in enumerate(loads)
+            if load.caretaker.daily_time_available > 0
+        ]
+        heapq.heapify(heap)
+        unassigned: List[Task] = []
+        max_remaining = max((load.remaining for load in loads), default=0)
+
+        for task in tasks:
+            if task.duration_minutes > max_remaining:
+                # nobody has the minutes left; skip the heap scan
+                unassigned.append(task)
+                continue
+            skipped = []
+            chosen: Optional[int] = None
+            while heap:
+                util, i = heapq.heappop(heap)
+                if util != loads[i].utilization:
+                    continue  # stale entry, a fresher one is in the heap
+                if loads[i].can_take(task):
+                    chosen = i
+                    break
+                skipped.append((util, i))
+            for entry in skipped:
+                heapq.heappush(heap, entry)
+
+            if chosen is None:
+                unassigned.append(task)
+                continue
+            before = loads[chosen].remaining
+            loads[chosen].add(task)
+            heapq.heappush(heap, (loads[chosen].utilization, chosen))
+            if before == max_remaining:
+                max_remaining = max(load.remaining for load in loads)
+        return unassigned
+
+    def _rebalance(self, loads: List[_Load], deadline: float) -> None:
+        active = [load for load in loads if load.caretaker.daily_time_available > 0]
+        while clock.perf_counter() < deadline and len(active) > 1:
+            busiest = max(active, key=lambda load: load.utilization)
+            if not self._move_one(busiest, active, deadline):
+                return
+
+    def _move_one(self, busiest: _Load, loads: List[_Load], deadline: float) -> bool:
+        """
+        Moves one task off the busiest caretaker to one that stays below the
+        busiest's current utilization. Returns False if no such move exists.
+        """
+        current = busiest.utilization
+        others = sorted(
+            (load for load in loads if load is not busiest), key=lambda load: load.utilization
+        )
+        for task in sorted(busiest.tasks, key=lambda t: -t.duration_minutes):
+            if task.duration_minutes <= 0:
+                continue
+            for target in others:
+                if clock.perf_counter() >= deadline:
+                    return False
+                if target.utilization_with(task.duration_minutes) >= current:
+                    continue
+                if target.can_take(task):
+                    busiest.remove(task)
+                    target.add(task)
+                    return True
+        return False
@@ -0,0 +1,380 @@
+import json
+import os
+import uuid
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from pawpal_system import (
+    Owner,
+    Pet,
+    Task,
+    owner_from_dict,
+    owner_to_dict,
+    pet_from_dict,
+    pet_to_dict,
+    task_from_dict,
+    task_to_dict,
+)
+from pawpal_snapshot import source_stamp, stamp_is_current
+
+# -------------------------
+# Change feed
+# -------------------------
+#
+# Kinds and their data:
+#   owner_added       {"owner": owner dict}
+#   owner_removed     {}
+#   pet_added         {"pet": pet dict}
+#   budget_changed    {"minutes": int}
+#   task_added        {"pet": name, "task": task dict}
+#   recurrence_created {"pet": name, "task": task dict}
+#   task_removed      {"pet": name, "number": int}
+#   task_completed    {"pet": name, "number": int}
+#   task_reopened     {"pet": name, "number": int}
+
+
+@dataclass(frozen=True)
+class Change:
+    version: int
+    kind: str
+    owner: str
+    data: dict
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "kind": self.kind,
+            "owner": self.owner,
+            "data": self.data,
+        }
+
+
+class ChangeFeed:
+    """
+    Stamps every mutation of the tracked owners with an increasing version.
+
+    A checkpoint (full copy of the owners) is taken every checkpoint_every
+    changes. Changes are kept from the previous checkpoint onwards, so a
+    replica that is at most about two checkpoint intervals behind gets only
+    its missing changes; anyone further behind gets the latest checkpoint
+    plus the changes after it.
+
+    A pet shared by several tracked owners reports each of its changes once
+    per owner, since every owner gets its own copy of the pet on a replica.
+
+    checkpoint_source, if given, returns the owner dicts for a checkpoint; a
+    lazy store uses it to include owners it has not loaded (and so not tracked).
+    """
+
+    def __init__(
+        self,
+        owners: Optional[List[Owner]] = None,
+        checkpoint_every: int = 1000,
+        checkpoint_source: Optional[Callable[[], List[dict]]] = None,
+    ) -> None:
+        # a replica holding versions from another feed (e.g. before a restart)
+        # cannot trust version numbers alone, so deltas also carry the epoch
+        self.epoch = uuid.uuid4().hex
+        self.version = 0
+        self.checkpoint_every = checkpoint_every
+        self.owners: List[Owner] = []
+        self._changes: List[Change] = []
+        self._versions: List[int] = []  # parallel to _changes, for bisect
+        self._checkpoints: List[Tuple[int, List[dict]]] = []  # at most two, oldest first
+        self._pet_owners: Dict[int, List[Owner]] = {}  # id(pet) -> tracked owners holding it
+        self._checkpoint_source = checkpoint_source
+        for owner in owners or []:
+            self.track(owner)
+        self.checkpoint()
+
+    # --- tracking ---
+
+    def track(self, owner: Owner) -> None:
+        """
+        Watches an owner the log already covers (e.g. one loaded lazily)
+        without recording a change.
+        """
+        self.owners.append(owner)
+        self._watch_owner(owner)
+
+    def add_owner(self, owner: Owner) -> None:
+        self.owners.append(owner)
+        self._watch_owner(owner)
+        self._record("owner_added", owner.name, {"owner": owner_to_dict(owner)})
+
+    def remove_owner(self, owner_name: str) -> bool:
+        for owner in self.owners:
+            if owner.name == owner_name:
+                self.owners.remove(owner)
+                self._unwatch_owner(owner)
+                self._record("owner_removed", owner_name, {})
+                return True
+        return False
+
+    def _watch_owner(self, owner: Owner) -> None:
+        def on_owner_change(kind: str, **data) -> None:
+            if kind == "pet_added":
+                self._watch_pet(owner, data["pet"])
+                self._record(kind, owner.name, {"pet": pet_to_dict(data["pet"])})
+            else:
+                self._record(kind, owner.name, data)
+
+        owner._observer = on_owner_change
+        for pet in owner.pets:
+            self._watch_pet(owner, pet)
+
+    def _watch_pet(self, owner: Owner, pet: Pet) -> None:
+        holders = self._pet_owners.get(id(pet))
+        if holders is not None:
+            # already watched through another owner; just report to this one too
+            if not any(holder is owner for holder in holders):
+                holders.append(owner)
+            return
+        holders = self._pet_owners[id(pet)] = [owner]
+
+        def on_pet_change(kind: str, task: Task) -> None:
+            if kind == "task_removed":
+                task._observer = None
+                data = {"pet": pet.name, "number": task.number}
+            else:  # task_added, recurrence_created
+                self._watch_task(pet, task)
+                data = {"pet": pet.name, "task": task_to_dict(task)}
+            for holder in holders:
+                self._record(kind, holder.name, data)
+
+        pet._observer = on_pet_change
+        for task in pet.tasks:
+            self._watch_task(pet, task)
+
+    def _watch_task(self, pet: Pet, task: Task) -> None:
+        holders = self._pet_owners[id(pet)]
+
+        def on_task_change(kind: str, task: Task) -> None:
+            for holder in holders:
+                self._record(kind, holder.name, {"pet": pet.name, "number": task.number})
+
+        task._observer = on_task_change
+
+    def _unwatch_owner(self, owner: Owner) -> None:
+        owner._observer = None
+        for pet in owner.pets:
+            holders = self._pet_owners.get(id(pet), [])
+            # by identity: Owner is a dataclass, so == compares field values
+            holders[:] = [holder for holder in holders if holder is not owner]
+            if holders:
+                continue  # still held by another tracked owner
+            self._pet_owners.pop(id(pet), None)
+            pet._observer = None
+            for task in pet.tasks:
+                task._observer = None
+
+    # --- log ---
+
+    def _record(self, kind: str, owner_name: str, data: dict) -> None:
+        self.version += 1
+        self._changes.append(Change(self.version, kind, owner_name, data))
+        self._versions.append(self.version)
+        if self.version - self._checkpoints[-1][0] >= self.checkpoint_every:
+            self.checkpoint()
+
+    def checkpoint(self) -> int:
+        """
+        Takes a full copy of the tracked owners at the current version and
+        drops changes that are older than the previous checkpoint.
+        """
+        if self._checkpoint_source is not None:
+            payload = self._checkpoint_source()
+        else:
+            payload = [owner_to_dict(o) for o in self.owners]
+        self._checkpoints.append((self.version, payload))
+        if len(self._checkpoints) > 2:
+            self._checkpoints.pop(0)
+        keep_from = bisect_right(self._versions, self._checkpoints[0][0])
+        del self._changes[:keep_from]
+        del self._versions[:keep_from]
+        return self.version
+
+    def changes_since(self, version: int) -> Optional[List[Change]]:
+        """
+        Returns the changes after version, or None if some of them have
+        already been dropped (the caller then needs a checkpoint).
+        """
+        if version > self.version:
+            raise ValueError(f"Version {version} is ahead of the feed ({self.version})")
+        oldest_known = self._checkpoints[0][0]
+        if version < oldest_known:
+            return None
+        return self._changes[bisect_right(self._versions, version):]
+
+    def delta_since(self, version: int, epoch: Optional[str] = None) -> dict:
+        """
+        Returns a JSON-ready delta that brings a replica at version up to date:
+        {"epoch", "from", "to", "checkpoint": owners or None, "changes": [...]}.
+        Pass the epoch of the feed the replica last synced with; if it differs,
+        the delta starts from a checkpoint.
+        """
+        changes = None
+        if epoch in (None, self.epoch) and version <= self.version:
+            changes = self.changes_since(version)
+        checkpoint = None
+        if changes is None:
+            version, checkpoint = self._checkpoints[-1]
+            changes = self._changes[bisect_right(self._versions, version):]
+        return {
+            "epoch": self.epoch,
+            "from": version,
+            "to": self.version,
+            "checkpoint": checkpoint,
+            "changes": [change.to_dict() for change in changes],
+        }
+
+    def export_delta(
+        self, version: int, file_path: Union[str, Path], epoch: Optional[str] = None
+    ) -> dict:
+        delta = self.delta_since(version, epoch)
+        Path(file_path).write_text(json.dumps(delta, indent=2), encoding="utf-8")
+        return delta
+
+    # --- persistence ---
+
+    def to_state(self) -> dict:
+        return {
+            "epoch": self.epoch,
+            "version": self.version,
+            "checkpoint_every": self.checkpoint_every,
+            "checkpoints": [[version, owners] for version, owners in self._checkpoints],
+            "changes": [change.to_dict() for change in self._changes],
+        }
+
+    @classmethod
+    def from_state(
+        cls,
+        state: dict,
+        owners: Optional[List[Owner]] = None,
+        checkpoint_source: Optional[Callable[[], List[dict]]] = None,
+    ) -> "ChangeFeed":
+        """
+        Restores a feed saved with to_state. owners are the live owners the
+        saved log already covers; they are tracked without recording anything.
+        """
+        feed = cls.__new__(cls)
+        feed.epoch = state["epoch"]
+        feed.version = int(state["version"])
+        feed.checkpoint_every = int(state["checkpoint_every"])
+        feed.owners = []
+        feed._changes = [Change(**change) for change in state["changes"]]
+        feed._versions = [change.version for change in feed._changes]
+        feed._checkpoints = [(int(version), owners) for version, owners in state["checkpoints"]]
+        feed._pet_owners = {}
+        feed._checkpoint_source = checkpoint_source
+        for owner in owners or []:
+            feed.track(owner)
+        return feed
+
+
+# -------------------------
+# Replica side
+# -------------------------
+
+def _find_pet(owner: Owner, pet_name: str) -> Pet:
+    for pet in owner.pets:
+        if pet.name == pet_name:
+            return pet
+    raise KeyError(f"Owner '{owner.name}' has no pet '{pet_name}'")
+
+
+def apply_delta(owners: List[Owner], delta: dict) -> List[Owner]:
+    """
+    Applies a delta from ChangeFeed.delta_since to a replica's owners and
+    returns the updated list (a new list if the delta carries a checkpoint).
+    """
+    if delta.get("checkpoint") is not None:
+        owners = [owner_from_dict(data) for data in delta["checkpoint"]]
+    by_name = {owner.name: owner for owner in owners}
+
+    for change in delta.get("changes", []):
+        kind, data = change["kind"], change["data"]
+        if kind == "owner_added":
+            owner = owner_from_dict(data["owner"])
+            owners.append(owner)
+            by_name[owner.name] = owner
+            continue
+        owner = by_name[change["owner"]]
+        if kind == "owner_removed":
+            owners.remove(owner)
+            del by_name[owner.name]
+        elif kind == "pet_added":
+            owner.add_pet(pet_from_dict(data["pet"]))
+        elif kind == "budget_changed":
+            owner.daily_time_available = data["minutes"]
+        elif kind in ("task_added", "recurrence_created"):
+            pet = _find_pet(owner, data["pet"])
+            pet.add_task(task_from_dict(data["task"], pet.name))
+        elif kind == "task_removed":
+            _find_pet(owner, data["pet"]).remove_task(data["number"])
+        elif kind in ("task_completed", "task_reopened"):
+            for task in _find_pet(owner, data["pet"]).tasks:
+                if task.number == data["number"]:
+                    task.completed = kind == "task_completed"
+        else:
+            raise ValueError(f"Unknown change kind: {kind!r}")
+    return owners
+
+
+def load_delta(file_path: Union[str, Path]) -> dict:
+    return json.loads(Path(file_path).read_text(encoding="utf-8"))
+
+
+# -------------------------
+# Feed file
+# -------------------------
+#
+# The feed is saved next to data.json together with the stamp of the
+# data.json it describes. If data.json was changed by anything else, the
+# saved log no longer matches it and a new feed (new epoch) is started.
+
+def feed_path_for(json_path: Union[str, Path]) -> Path:
+    return Path(json_path).with_suffix(".changes.json")
+
+
+def save_feed(
+    feed: ChangeFeed,
+    json_path: Union[str, Path] = "data.json",
+    feed_path: Optional[Union[str, Path]] = None,
+) -> None:
+    """
+    Saves the feed for the data.json that was just written to json_path.
+    """
+    path = Path(feed_path) if feed_path is not None else feed_path_for(json_path)
+    mtime_ns, size, digest = source_stamp(json_path)
+    state = feed.to_state()
+    state["source"] = {"mtime_ns": mtime_ns, "size": size, "sha256": digest.hex()}
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(state), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def load_feed(
+    json_path: Union[str, Path] = "data.json",
+    feed_path: Optional[Union[str, Path]] = None,
+    owners: Optional[List[Owner]] = None,
+    checkpoint_source: Optional[Callable[[], List[dict]]] = None,
+) -> Optional[ChangeFeed]:
+    """
+    Restores the saved feed for json_path, or returns None if there is none,
+    it is unreadable, or json_path changed since it was saved.
+    """
+    path = Path(feed_path) if feed_path is not None else feed_path_for(json_path)
+    if not path.exists():
+        return None
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+        source = state["source"]
+        stamp = (int(source["mtime_ns"]), int(source["size"]), bytes.fromhex(source["sha256"]))
+        if not stamp_is_current(stamp, json_path):
+            return None
+        return ChangeFeed.from_state(state, owners, checkpoint_source)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
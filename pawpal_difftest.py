@@ -0,0 +1,293 @@
+import copy
+import json
+import random
+import tempfile
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pawpal_snapshot import Snapshot, load_owners, save_owners, write_snapshot
+from pawpal_system import Owner, Scheduler, Task, owner_from_dict, owner_to_dict
+
+# -------------------------
+# Differential testing
+# -------------------------
+#
+# Random scenarios run through the reference code in pawpal_system and
+# through every registered candidate implementation. Any difference is
+# shrunk to a small scenario that still shows it.
+#
+# Candidate signatures per kind:
+#   generate_plan     fn(owner) -> (plan, explanation)
+#   detect_conflicts  fn(tasks) -> warnings
+#   persistence       (save(owners, path), load(path) -> owners)
+
+KINDS = ("generate_plan", "detect_conflicts", "persistence")
+
+REFERENCE: Dict[str, Any] = {
+    "generate_plan": lambda owner: Scheduler().generate_plan(owner),
+    "detect_conflicts": lambda tasks: Scheduler().detect_conflicts(tasks),
+    "persistence": (Owner.save_to_json, Owner.load_from_json),
+}
+
+_candidates: Dict[str, Dict[str, Any]] = {kind: {} for kind in KINDS}
+
+
+def register(kind: str, name: str, implementation: Any) -> None:
+    if kind not in KINDS:
+        raise ValueError(f"Unknown kind {kind!r}; expected one of {', '.join(KINDS)}")
+    _candidates[kind][name] = implementation
+
+
+def _load_snapshot(path: str) -> List[Owner]:
+    with Snapshot(path) as snapshot:
+        return snapshot.load_owners()
+
+
+# the engines that already exist next to the reference
+register("persistence", "binary snapshot", (write_snapshot, _load_snapshot))
+register("persistence", "warm-start cache", (save_owners, load_owners))
+
+
+def unregister(kind: str, name: str) -> None:
+    _candidates[kind].pop(name, None)
+
+
+def candidates(kind: str) -> Dict[str, Any]:
+    return dict(_candidates[kind])
+
+
+@dataclass
+class Scenario:
+    owners: List[dict]  # owner_to_dict payloads
+    completions: List[int] = field(default_factory=list)  # marked complete first, in order
+    seed: Optional[int] = None
+
+
+@dataclass
+class Mismatch:
+    kind: str
+    implementation: str
+    seed: Optional[int]
+    scenario: Scenario  # minimized
+    expected: Any
+    actual: Any
+
+    def __str__(self) -> str:
+        return "\n".join([
+            f"{self.kind}: '{self.implementation}' differs from the reference (seed {self.seed})",
+            "minimized scenario:",
+            json.dumps(
+                {"owners": self.scenario.owners, "completions": self.scenario.completions},
+                indent=2,
+                ensure_ascii=False,
+            ),
+            f"expected: {self.expected!r}",
+            f"actual:   {self.actual!r}",
+        ])
+
+
+# -------------------------
+# Scenario generation
+# -------------------------
+
+_DESCRIPTIONS = ["Walk", "Feed", "Meds", "Brush", "Play", 'Say "hi"', "Füttern", "Nap, then snack"]
+_DURATIONS = [0, 1, 5, 10, 15, 20, 30, 45, 60, 90]
+
+
+def generate_scenario(rng: random.Random, seed: Optional[int] = None) -> Scenario:
+    """
+    Small random owners built to hit the edge cases: equal priorities and start
+    times, zero budgets and durations, overlapping windows, completed and
+    recurring tasks, and text that needs escaping.
+    """
+    base = date(2024, 1, 1)
+    number = 0
+    owners: List[dict] = []
+    for o in range(rng.randint(1, 3)):
+        budget = rng.choice([0, 0, 1440, rng.randint(0, 240)])
+        pets = []
+        for p in range(rng.randint(0, 3)):
+            pet_name = f"Pet{o}{p}"
+            tasks = []
+            for _ in range(rng.randint(0, 10)):
+                number += 1
+                tasks.append({
+                    "number": number,
+                    "description": rng.choice(_DESCRIPTIONS),
+                    "duration_minutes": rng.choice(_DURATIONS),
+                    "priority": rng.choice(["low", "medium", "high"]),
+                    # a narrow band of start times so ties and overlaps are common
+                    "time": rng.choice([0, 1439, rng.randrange(420, 600, 5)]),
+                    "pet_name": pet_name,
+                    "frequency": rng.choice(["daily", "weekly", "monthly"]),
+                    "completed": rng.random() < 0.2,
+                    "due_date": (base + timedelta(days=rng.randint(0, 30))).isoformat(),
+                })
+            species = rng.choice(["Dog", "Cat", "Other"])
+            pets.append({"name": pet_name, "species": species, "tasks": tasks})
+        owners.append({"name": f"Owner{o}", "daily_time_available": budget, "pets": pets})
+
+    completions = rng.sample(range(1, number + 1), k=min(number, rng.randint(0, 3)))
+    return Scenario(owners=owners, completions=completions, seed=seed)
+
+
+def build_owners(scenario: Scenario) -> List[Owner]:
+    """
+    Fresh Owner objects for one run, with the scenario's completions applied.
+    Task numbering restarts from the scenario's own numbers so recurrences get
+    the same numbers in every run; the global counter never moves backwards.
+    """
+    saved_counter = Task._counter
+    Task._counter = 0
+    try:
+        owners = [owner_from_dict(data) for data in scenario.owners]
+        scheduler = Scheduler()
+        for task_number in scenario.completions:
+            for owner in owners:
+                if scheduler.mark_task_complete(owner, task_number):
+                    break
+    finally:
+        run_counter = Task._counter
+        Task._counter = max(saved_counter, run_counter)
+    return owners
+
+
+# -------------------------
+# Running one implementation
+# -------------------------
+
+def _plan_outcome(result: Tuple[list, Any]) -> Tuple[List[int], List[str]]:
+    plan, explanation = result
+    return [t.number for t in plan], list(explanation)
+
+
+def _persistence_outcome(engine: Tuple[Callable, Callable], owners: List[Owner]) -> List[dict]:
+    save, load = engine
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "data.json")
+        save(owners, path)
+        return [owner_to_dict(o) for o in load(path)]
+
+
+def outcome(kind: str, implementation: Any, scenario: Scenario) -> Any:
+    owners = build_owners(scenario)
+    if kind == "generate_plan":
+        return [_plan_outcome(implementation(owner)) for owner in owners]
+    if kind == "detect_conflicts":
+        return [list(implementation(owner.get_all_tasks())) for owner in owners]
+    if kind == "persistence":
+        return _persistence_outcome(implementation, owners)
+    raise ValueError(f"Unknown kind {kind!r}")
+
+
+def _differs(kind: str, implementation: Any, scenario: Scenario) -> Optional[Tuple[Any, Any]]:
+    expected = outcome(kind, REFERENCE[kind], scenario)
+    try:
+        actual = outcome(kind, implementation, scenario)
+    except Exception as exc:  # a crash is a difference too
+        actual = f"raised {exc!r}"
+    return None if actual == expected else (expected, actual)
+
+
+# -------------------------
+# Shrinking
+# -------------------------
+
+def _smaller_scenarios(scenario: Scenario):
+    """
+    Yields candidate scenarios that are each one step simpler.
+    """
+    owners = scenario.owners
+    for i in range(len(owners)):
+        if len(owners) > 1:
+            yield Scenario(owners[:i] + owners[i + 1:], scenario.completions, scenario.seed)
+    for i in range(len(scenario.completions)):
+        completions = scenario.completions[:i] + scenario.completions[i + 1:]
+        yield Scenario(owners, completions, scenario.seed)
+
+    for o, owner in enumerate(owners):
+        for p in range(len(owner["pets"])):
+            smaller = copy.deepcopy(owners)
+            del smaller[o]["pets"][p]
+            yield Scenario(smaller, scenario.completions, scenario.seed)
+        for p, pet in enumerate(owner["pets"]):
+            for t in range(len(pet["tasks"])):
+                smaller = copy.deepcopy(owners)
+                del smaller[o]["pets"][p]["tasks"][t]
+                yield Scenario(smaller, scenario.completions, scenario.seed)
+
+    for o, owner in enumerate(owners):
+        if owner["daily_time_available"]:
+            smaller = copy.deepcopy(owners)
+            smaller[o]["daily_time_available"] //= 2
+            yield Scenario(smaller, scenario.completions, scenario.seed)
+        for p, pet in enumerate(owner["pets"]):
+            for t, task in enumerate(pet["tasks"]):
+                for key in ("duration_minutes", "time"):
+                    if task[key]:
+                        smaller = copy.deepcopy(owners)
+                        smaller[o]["pets"][p]["tasks"][t][key] //= 2
+                        yield Scenario(smaller, scenario.completions, scenario.seed)
+
+
+def minimize(
+    kind: str, implementation: Any, scenario: Scenario, max_steps: int = 2000
+) -> Scenario:
+    """
+    Greedily applies simplifications that keep the difference, until none does.
+    """
+    steps = 0
+    improved = True
+    while improved and steps < max_steps:
+        improved = False
+        for smaller in _smaller_scenarios(scenario):
+            steps += 1
+            if _differs(kind, implementation, smaller) is not None:
+                scenario = smaller
+                improved = True
+                break
+            if steps >= max_steps:
+                break
+    return scenario
+
+
+# -------------------------
+# Entry point
+# -------------------------
+
+def run(
+    scenarios: int = 200,
+    seed: int = 0,
+    kinds: Tuple[str, ...] = KINDS,
+    stop_at_first: bool = True,
+) -> List[Mismatch]:
+    """
+    Runs every registered candidate against the reference on random scenarios.
+    Returns one minimized Mismatch per failing (kind, implementation); with
+    stop_at_first, a candidate stops being tested after its first failure.
+    """
+    mismatches: List[Mismatch] = []
+    failed = set()
+    for i in range(scenarios):
+        scenario_seed = seed + i
+        scenario = generate_scenario(random.Random(scenario_seed), scenario_seed)
+        for kind in kinds:
+            for name, implementation in _candidates[kind].items():
+                if stop_at_first and (kind, name) in failed:
+                    continue
+                if _differs(kind, implementation, scenario) is None:
+                    continue
+                small = minimize(kind, implementation, scenario)
+                expected, actual = _differs(kind, implementation, small)
+                mismatches.append(Mismatch(kind, name, scenario_seed, small, expected, actual))
+                failed.add((kind, name))
+    return mismatches
+
+
+if __name__ == "__main__":
+    found = run()
+    for mismatch in found:
+        print(mismatch, end="\n\n")
+    print(f"{len(found)} mismatch(es)" if found else "All candidates match the reference.")
@@ -0,0 +1,190 @@
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from pawpal_system import Owner, Scheduler, Task
+
+logger = logging.getLogger(__name__)
+
+# -------------------------
+# Reminder dispatch
+# -------------------------
+
+
+@dataclass(frozen=True)
+class Reminder:
+    task: Task
+    starts_at: datetime
+    fire_at: datetime
+
+
+ReminderCallback = Callable[[Reminder], Union[None, Awaitable[None]]]
+
+
+def task_start(task: Task) -> datetime:
+    return datetime.combine(task.due_date, datetime.min.time()) + timedelta(minutes=task.time)
+
+
+class ReminderDispatcher:
+    """
+    Fires callbacks lead_minutes before each pending task starts.
+
+    Pending reminders live in a min-heap keyed on fire time, so scheduling is
+    O(log n). Cancelling is O(1): the task's entry is dropped from the index and
+    its heap slot becomes a tombstone that is skipped when popped (and swept out
+    once tombstones outnumber live entries).
+    """
+
+    def __init__(
+        self,
+        lead_minutes: int = 15,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self.lead = timedelta(minutes=lead_minutes)
+        self._clock = clock
+        self._heap: List[Tuple[datetime, int, int]] = []  # fire_at, seq, task number
+        self._pending: Dict[int, Tuple[int, Reminder]] = {}  # task number -> (seq, reminder)
+        self._seq = itertools.count()
+        self._callbacks: List[ReminderCallback] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopped = False
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def on_reminder(self, callback: ReminderCallback) -> None:
+        """
+        Registers a callback. It may be a plain function or return an awaitable
+        (e.g. an async def), which run()/dispatch_due() will await.
+        """
+        self._callbacks.append(callback)
+
+    def attach(self, scheduler: Scheduler) -> None:
+        """
+        Keeps reminders in step with scheduler.mark_task_complete: the completed
+        task's reminder is cancelled and the next recurrence (if any) is scheduled.
+        """
+        scheduler.add_completion_listener(self._on_task_completed)
+
+    def _on_task_completed(self, task: Task, next_task: Optional[Task]) -> None:
+        self.cancel(task.number)
+        if next_task is not None:
+            self.schedule(next_task)
+
+    def schedule(self, task: Task) -> Optional[Reminder]:
+        """
+        Schedules (or reschedules) the reminder for a task.
+        Returns None if the task is completed or has already started.
+        """
+        self.cancel(task.number)
+        if task.completed:
+            return None
+        starts_at = task_start(task)
+        if starts_at <= self._clock():
+            return None
+
+        reminder = Reminder(task=task, starts_at=starts_at, fire_at=starts_at - self.lead)
+        seq = next(self._seq)
+        self._pending[task.number] = (seq, reminder)
+        heapq.heappush(self._heap, (reminder.fire_at, seq, task.number))
+
+        # a new earliest reminder means the run() loop is sleeping too long
+        if self._wakeup is not None and self._heap[0][1] == seq:
+            self._wakeup.set()
+        return reminder
+
+    def schedule_owner(self, owner: Owner) -> int:
+        """
+        Schedules every pending task of an owner. Returns how many were scheduled.
+        """
+        return sum(self.schedule(task) is not None for task in owner.get_all_tasks())
+
+    def cancel(self, task_number: int) -> bool:
+        if self._pending.pop(task_number, None) is None:
+            return False
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._pending):
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        self._heap = [
+            (reminder.fire_at, seq, number)
+            for number, (seq, reminder) in self._pending.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def _is_live(self, entry: Tuple[datetime, int, int]) -> bool:
+        pending = self._pending.get(entry[2])
+        return pending is not None and pending[0] == entry[1]
+
+    def next_fire_at(self) -> Optional[datetime]:
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Reminder]:
+        """
+        Removes and returns every reminder whose fire time has passed,
+        without calling callbacks. Useful for polling from synchronous code.
+        """
+        now = self._clock() if now is None else now
+        due: List[Reminder] = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                due.append(self._pending.pop(entry[2])[1])
+        return due
+
+    async def dispatch_due(self, now: Optional[datetime] = None) -> List[Reminder]:
+        """
+        Pops due reminders and hands each one to every callback.
+        A callback that raises is logged and skipped, so the rest of the batch
+        is still delivered and run() keeps going.
+        """
+        due = self.pop_due(now)
+        for reminder in due:
+            for callback in self._callbacks:
+                try:
+                    result = callback(reminder)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    logger.exception(
+                        "Reminder callback failed for task %s", reminder.task.number
+                    )
+        return due
+
+    async def run(self) -> None:
+        """
+        Dispatches reminders as they come due until stop() is called.
+        Sleeps until the next fire time, or until an earlier reminder is scheduled.
+        """
+        self._wakeup = asyncio.Event()
+        self._stopped = False
+        try:
+            while not self._stopped:
+                # clear before dispatching so a schedule()/stop() from a callback is not lost
+                self._wakeup.clear()
+                await self.dispatch_due()
+                if self._stopped:
+                    break
+                next_at = self.next_fire_at()
+                timeout = None
+                if next_at is not None:
+                    timeout = max(0.0, (next_at - self._clock()).total_seconds())
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wakeup = None
+
+    def stop(self) -> None:
+        self._stopped = True
+        if self._wakeup is not None:
+            self._wakeup.set()
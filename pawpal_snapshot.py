@@ -0,0 +1,335 @@
+import hashlib
+import mmap
+import os
+import struct
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from pawpal_system import Owner, Pet, Task
+
+# -------------------------
+# Binary snapshot format
+# -------------------------
+#
+# header | owner records | pet records | task records | string offsets | string blob
+#
+# Records are fixed width so any owner, pet or task can be found by index
+# without touching the rest of the file. Text lives once in the string table
+# and records point at it by index.
+
+MAGIC = b"PAWSNAP\x00"
+FORMAT_VERSION = 1
+
+# magic, version, reserved, source mtime_ns, source size, source sha256,
+# owner count, pet count, task count, string count
+_HEADER = struct.Struct("<8sHHqq32sIIII")
+# name, daily_time_available, first pet, pet count
+_OWNER = struct.Struct("<IiII")
+# name, species, first task, task count
+_PET = struct.Struct("<IIII")
+# number, description, duration, time, pet_name, frequency, due_date ordinal,
+# priority rank, completed
+_TASK = struct.Struct("<IIiiIIiBB2x")
+_OFFSET = struct.Struct("<I")
+
+_RANK_PRIORITIES = {rank: name for name, rank in Task._PRIORITY_RANKS.items()}
+
+SourceStamp = Tuple[int, int, bytes]  # mtime_ns, size, sha256
+_EMPTY_STAMP: SourceStamp = (0, 0, b"\x00" * 32)
+
+
+def snapshot_path_for(json_path: Union[str, Path]) -> Path:
+    return Path(json_path).with_suffix(".pawsnap")
+
+
+def _file_digest(path: Path) -> bytes:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def source_stamp(path: Union[str, Path]) -> SourceStamp:
+    path = Path(path)
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size, _file_digest(path)
+
+
+def write_snapshot(
+    owners: List[Owner],
+    file_path: Union[str, Path],
+    source_path: Optional[Union[str, Path]] = None,
+) -> None:
+    """
+    Writes owners to a binary snapshot.
+    If source_path is given, the snapshot is stamped with that file's
+    mtime/size/hash so load_owners can tell whether it is still current.
+    """
+    strings: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    owner_rows = bytearray()
+    pet_rows = bytearray()
+    task_rows = bytearray()
+    pet_count = 0
+    task_count = 0
+
+    for owner in owners:
+        owner_rows += _OWNER.pack(
+            intern(owner.name), owner.daily_time_available, pet_count, len(owner.pets)
+        )
+        for pet in owner.pets:
+            pet_rows += _PET.pack(
+                intern(pet.name), intern(pet.species), task_count, len(pet.tasks)
+            )
+            for task in pet.tasks:
+                task_rows += _TASK.pack(
+                    task.number,
+                    intern(task.description),
+                    task.duration_minutes,
+                    task.time,
+                    intern(task.pet_name),
+                    intern(task.frequency),
+                    task.due_date.toordinal(),
+                    task.priority_rank,
+                    task.completed,
+                )
+            task_count += len(pet.tasks)
+        pet_count += len(owner.pets)
+
+    blob = bytearray()
+    offsets = bytearray()
+    for value in strings:  # dicts keep insertion order, which matches the indexes
+        offsets += _OFFSET.pack(len(blob))
+        blob += value.encode("utf-8")
+    offsets += _OFFSET.pack(len(blob))
+
+    stamp = source_stamp(source_path) if source_path is not None else _EMPTY_STAMP
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0, *stamp, len(owners), pet_count, task_count, len(strings)
+    )
+
+    # write to a temp file and swap it in so readers never see a half-written snapshot
+    path = Path(file_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as handle:
+        for part in (header, owner_rows, pet_rows, task_rows, offsets, blob):
+            handle.write(part)
+    os.replace(tmp_path, path)
+
+
+class Snapshot:
+    """
+    Read-only view of a snapshot file through mmap.
+    Nothing is decoded up front: owners, pets and tasks are built only
+    when asked for, so opening a large snapshot costs the same as a small one.
+    """
+
+    def __init__(self, file_path: Union[str, Path]) -> None:
+        self.path = Path(file_path)
+        with self.path.open("rb") as handle:
+            self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+        except ValueError:
+            self._mm.close()
+            raise
+        except struct.error as exc:
+            self._mm.close()
+            raise ValueError(f"{self.path} is truncated or corrupt") from exc
+        self._strings: Dict[int, str] = {}
+
+    def _read_header(self) -> None:
+        if len(self._mm) < _HEADER.size:
+            raise ValueError(f"{self.path} is too small to be a snapshot")
+        (
+            magic,
+            version,
+            _reserved,
+            mtime_ns,
+            size,
+            digest,
+            self.owner_count,
+            self.pet_count,
+            self.task_count,
+            self.string_count,
+        ) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} snapshot")
+        self.source_stamp: SourceStamp = (mtime_ns, size, digest)
+
+        self._owners_at = _HEADER.size
+        self._pets_at = self._owners_at + self.owner_count * _OWNER.size
+        self._tasks_at = self._pets_at + self.pet_count * _PET.size
+        self._offsets_at = self._tasks_at + self.task_count * _TASK.size
+        self._blob_at = self._offsets_at + (self.string_count + 1) * _OFFSET.size
+        blob_size = _OFFSET.unpack_from(
+            self._mm, self._offsets_at + self.string_count * _OFFSET.size
+        )[0]
+        if self._blob_at + blob_size != len(self._mm):
+            raise ValueError(f"{self.path} is truncated or corrupt")
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _string(self, index: int) -> str:
+        value = self._strings.get(index)
+        if value is None:
+            start, end = struct.unpack_from(
+                "<II", self._mm, self._offsets_at + index * _OFFSET.size
+            )
+            value = self._mm[self._blob_at + start : self._blob_at + end].decode("utf-8")
+            self._strings[index] = value
+        return value
+
+    def owner_names(self) -> List[str]:
+        return [self.owner_summary(i)[0] for i in range(self.owner_count)]
+
+    def owner_summary(self, index: int) -> Tuple[str, int, int]:
+        """
+        Returns (name, daily_time_available, pet count) without decoding pets or tasks.
+        """
+        name_idx, daily, _first_pet, pets = _OWNER.unpack_from(
+            self._mm, self._owners_at + index * _OWNER.size
+        )
+        return self._string(name_idx), daily, pets
+
+    def task_at(self, index: int) -> Task:
+        (
+            number,
+            description,
+            duration,
+            start,
+            pet_name,
+            frequency,
+            due_ordinal,
+            rank,
+            completed,
+        ) = _TASK.unpack_from(self._mm, self._tasks_at + index * _TASK.size)
+        task = Task(
+            description=self._string(description),
+            duration_minutes=duration,
+            priority=_RANK_PRIORITIES[rank],
+            time=start,
+            pet_name=self._string(pet_name),
+            frequency=self._string(frequency),
+            completed=bool(completed),
+            due_date=date.fromordinal(due_ordinal),
+        )
+        task.number = number
+        return task
+
+    def load_owner(self, index: int) -> Owner:
+        name_idx, daily, first_pet, pets = _OWNER.unpack_from(
+            self._mm, self._owners_at + index * _OWNER.size
+        )
+        owner = Owner(name=self._string(name_idx), daily_time_available=daily)
+        max_task_number = 0
+        for pet_index in range(first_pet, first_pet + pets):
+            pet_name, species, first_task, tasks = _PET.unpack_from(
+                self._mm, self._pets_at + pet_index * _PET.size
+            )
+            pet = Pet(name=self._string(pet_name), species=self._string(species))
+            for task_index in range(first_task, first_task + tasks):
+                task = self.task_at(task_index)
+                max_task_number = max(max_task_number, task.number)
+                pet.add_task(task)
+            owner.add_pet(pet)
+
+        # same rule as load_from_json: new tasks must not reuse loaded numbers
+        Task._counter = max(Task._counter, max_task_number)
+        return owner
+
+    def load_owners(self) -> List[Owner]:
+        return [self.load_owner(i) for i in range(self.owner_count)]
+
+
+# -------------------------
+# Warm-start cache
+# -------------------------
+
+def stamp_is_current(stamp: SourceStamp, source: Union[str, Path]) -> bool:
+    """
+    True if source still has the contents recorded in stamp (see source_stamp).
+    """
+    source = Path(source)
+    if not source.exists():
+        return False
+    mtime_ns, size, digest = stamp
+    stat = source.stat()
+    if stat.st_size != size:
+        return False
+    if stat.st_mtime_ns == mtime_ns:
+        return True
+    # touched but maybe not changed (copied, checked out again, ...)
+    return _file_digest(source) == digest
+
+
+def open_cached(
+    json_path: Union[str, Path] = "data.json",
+    snapshot_path: Optional[Union[str, Path]] = None,
+) -> Optional[Snapshot]:
+    """
+    Returns an open Snapshot that matches json_path, rebuilding it from JSON
+    only when the source changed since the snapshot was written.
+    Returns None if json_path does not exist.
+    """
+    source = Path(json_path)
+    if not source.exists():
+        return None
+    cache = Path(snapshot_path) if snapshot_path is not None else snapshot_path_for(source)
+
+    if cache.exists():
+        try:
+            snapshot = Snapshot(cache)
+        except (OSError, ValueError):
+            snapshot = None  # unreadable cache, rebuild below
+        if snapshot is not None:
+            if stamp_is_current(snapshot.source_stamp, source):
+                return snapshot
+            snapshot.close()
+
+    write_snapshot(Owner.load_from_json(str(source)), cache, source)
+    return Snapshot(cache)
+
+
+def load_owners(
+    json_path: Union[str, Path] = "data.json",
+    snapshot_path: Optional[Union[str, Path]] = None,
+) -> List[Owner]:
+    """
+    Drop-in replacement for Owner.load_from_json that skips JSON parsing
+    when the snapshot cache is still current.
+    """
+    snapshot = open_cached(json_path, snapshot_path)
+    if snapshot is None:
+        return []
+    with snapshot:
+        return snapshot.load_owners()
+
+
+def save_owners(
+    owners: List[Owner],
+    json_path: Union[str, Path] = "data.json",
+    snapshot_path: Optional[Union[str, Path]] = None,
+) -> None:
+    """
+    Saves owners to JSON (the interchange format) and refreshes the snapshot
+    so the next load_owners call is a warm start.
+    """
+    Owner.save_to_json(owners, str(json_path))
+    cache = Path(snapshot_path) if snapshot_path is not None else snapshot_path_for(json_path)
+    write_snapshot(owners, cache, json_path)
@@ -0,0 +1,99 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from pawpal_changes import ChangeFeed, load_feed, save_feed
+from pawpal_snapshot import Snapshot, open_cached, save_owners
+from pawpal_system import Owner, owner_to_dict
+
+# -------------------------
+# Lazy owner store
+# -------------------------
+
+
+class OwnerStore:
+    """
+    The app's owners, loaded on demand.
+
+    Opening the store maps the warm-start snapshot and reads nothing else;
+    an owner's pets and tasks are decoded the first time get() asks for them.
+    Owners that were never opened stay in the snapshot until save() needs them.
+
+    Every change made through loaded owners is versioned by self.feed, which
+    is saved next to data.json, so replicas keep syncing by delta across
+    restarts. Owners are tracked as they are loaded.
+    """
+
+    def __init__(self, json_path: Union[str, Path] = "data.json") -> None:
+        self.json_path = Path(json_path)
+        self._snapshot: Optional[Snapshot] = open_cached(self.json_path)
+        self._names: List[str] = self._snapshot.owner_names() if self._snapshot else []
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        self._loaded: Dict[str, Owner] = {}
+        self.feed: ChangeFeed = load_feed(
+            self.json_path, checkpoint_source=self._checkpoint_payload
+        ) or ChangeFeed(checkpoint_source=self._checkpoint_payload)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, owner_name: str) -> bool:
+        return owner_name in self._index or owner_name in self._loaded
+
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def is_loaded(self, owner_name: str) -> bool:
+        return owner_name in self._loaded
+
+    def summary(self, owner_name: str) -> Tuple[int, int]:
+        """
+        Returns (daily_time_available, pet count) without loading the owner.
+        """
+        owner = self._loaded.get(owner_name)
+        if owner is not None:
+            return owner.daily_time_available, len(owner.pets)
+        _name, daily, pets = self._snapshot.owner_summary(self._index[owner_name])
+        return daily, pets
+
+    def get(self, owner_name: str) -> Optional[Owner]:
+        owner = self._loaded.get(owner_name)
+        if owner is None and owner_name in self._index and self._snapshot is not None:
+            owner = self._snapshot.load_owner(self._index[owner_name])
+            self._loaded[owner_name] = owner
+            self.feed.track(owner)
+        return owner
+
+    def add(self, owner: Owner) -> None:
+        if owner.name in self:
+            raise ValueError(f"Owner '{owner.name}' already exists")
+        self._names.append(owner.name)
+        self._loaded[owner.name] = owner
+        self.feed.add_owner(owner)
+
+    def all(self) -> List[Owner]:
+        """
+        Every owner, loading the ones that have not been opened yet.
+        """
+        return [self.get(name) for name in self._names]
+
+    def _checkpoint_payload(self) -> List[dict]:
+        # owners that were never opened are read from the snapshot as-is
+        payload = []
+        for name in self._names:
+            owner = self._loaded.get(name)
+            if owner is None:
+                owner = self._snapshot.load_owner(self._index[name])
+            payload.append(owner_to_dict(owner))
+        return payload
+
+    def save(self) -> None:
+        owners = self.all()
+        # everything is in memory now; release the mapping before the file is replaced
+        self.close()
+        save_owners(owners, self.json_path)
+        save_feed(self.feed, self.json_path)
+
+    def close(self) -> None:
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from typing import Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+from pawpal_system import Owner, Task
+
+# -------------------------
+# Budget sweep
+# -------------------------
+
+MAX_BUDGET = 24 * 60
+
+
+class BudgetOutcome(NamedTuple):
+    budget: int
+    scheduled: int
+    minutes_used: int
+    marginal_task: Optional[int]  # number of the first task skipped for lack of time
+
+
+@dataclass
+class BudgetSweep:
+    """
+    Greedy plan outcome (same rules as Scheduler.generate_plan) for many budgets.
+    All arrays are aligned with budgets, which is sorted ascending.
+    """
+
+    budgets: np.ndarray
+    scheduled: np.ndarray
+    minutes_used: np.ndarray
+    marginal_task: np.ndarray  # -1 where nothing was skipped for lack of time
+    tasks: List[Task]  # incomplete tasks in plan order
+
+    def at(self, budget: int) -> BudgetOutcome:
+        i = int(np.searchsorted(self.budgets, budget))
+        if i == len(self.budgets) or self.budgets[i] != budget:
+            raise KeyError(f"Budget {budget} was not part of the sweep")
+        marginal = int(self.marginal_task[i])
+        return BudgetOutcome(
+            budget=int(budget),
+            scheduled=int(self.scheduled[i]),
+            minutes_used=int(self.minutes_used[i]),
+            marginal_task=marginal if marginal >= 0 else None,
+        )
+
+    def plan_at(self, budget: int) -> List[Task]:
+        """
+        Tasks generate_plan would select with this budget.
+        """
+        plan: List[Task] = []
+        remaining = budget
+        for task in self.tasks:
+            if task.duration_minutes <= remaining:
+                plan.append(task)
+                remaining -= task.duration_minutes
+        return plan
+
+
+def sweep_budgets(owner: Owner, budgets: Optional[Iterable[int]] = None) -> BudgetSweep:
+    """
+    Computes the plan outcome for every budget in one pass over the sorted tasks.
+    budgets defaults to every minute from 0 to 1440.
+
+    With prefix sums of the durations, each budget's run of tasks that fit
+    back to back is found by one searchsorted; the task right after that run is
+    its marginal task. Only the tail after the first skip needs the per-task
+    pass, which updates all budgets at once as NumPy vectors.
+    """
+    if budgets is None:
+        budget_values = np.arange(MAX_BUDGET + 1, dtype=np.int64)
+    else:
+        budget_values = np.unique(np.fromiter(budgets, dtype=np.int64))
+        if len(budget_values) and budget_values[0] < 0:
+            raise ValueError(f"Budgets cannot be negative: {int(budget_values[0])}")
+
+    tasks = [t for t in owner.get_all_tasks() if not t.completed]
+    # sort by priority (high to low), then by start time (earlier first)
+    tasks.sort(key=lambda t: (-t.priority_rank, t.time))
+    n = len(tasks)
+    durations = np.fromiter((t.duration_minutes for t in tasks), dtype=np.int64, count=n)
+    numbers = np.fromiter((t.number for t in tasks), dtype=np.int64, count=n)
+
+    prefix = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(durations, out=prefix[1:])
+
+    # first_skip[b]: index of the first task that does not fit budget b (n if all fit)
+    first_skip = np.searchsorted(prefix, budget_values, side="right") - 1
+    scheduled = first_skip.copy()
+    remaining = budget_values - prefix[first_skip]
+    marginal = np.full(len(budget_values), -1, dtype=np.int64)
+    skipped = first_skip < n
+    marginal[skipped] = numbers[first_skip[skipped]]
+
+    if skipped.any():
+        # smallest duration still ahead, to stop once nothing else can fit
+        suffix_min = np.minimum.accumulate(durations[::-1])[::-1]
+        for i in range(int(first_skip[skipped].min()) + 1, n):
+            # budgets whose first skip is still ahead need the tail too,
+            # so only stop once no skipped budget can fit anything
+            if remaining[skipped].max() < suffix_min[i]:
+                break
+            past_skip = first_skip < i
+            fits = past_skip & (remaining >= durations[i])
+            remaining[fits] -= durations[i]
+            scheduled[fits] += 1
+
+    return BudgetSweep(
+        budgets=budget_values,
+        scheduled=scheduled,
+        minutes_used=budget_values - remaining,
+        marginal_task=marginal,
+        tasks=tasks,
+    )
@@ -1,6 +1,11 @@
 from dataclasses import dataclass, field
-from typing import List, Tuple, ClassVar, Union
+from typing import (
+    Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, ClassVar, Union
+)
 from datetime import date, timedelta
+from enum import Enum
+from itertools import islice
+import csv
 import json
 from pathlib import Path
 
@@ -16,6 +21,10 @@ class Task:
     due_date: date = field(default_factory=date.today)
 
     number: int = field(init=False)
+    # change hook, called as _observer(kind, **data); wired up by pawpal_changes.ChangeFeed
+    _observer: Optional[Callable[..., None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     _counter: ClassVar[int] = 0 # class variable for unique numbering
     _PRIORITY_RANKS: ClassVar[dict[str, int]] = {"low": 1, "medium": 2, "high": 3}
 
@@ -46,6 +55,23 @@ class Task:
             return "medium"
         return "low"
 
+    @classmethod
+    def _reserve_numbers(cls, count: int) -> int:
+        """
+        Reserves a block of count task numbers and returns the first one.
+        """
+        first = cls._counter + 1
+        cls._counter += count
+        return first
+
+    @classmethod
+    def _from_normalized(cls, number: int, **fields) -> "Task":
+        # bulk import path: fields are already validated and the number is
+        # already reserved, so skip __post_init__
+        task = cls.__new__(cls)
+        task.__dict__.update(fields, number=number, _observer=None)
+        return task
+
     @property
     def priority_rank(self) -> int:
         return self._PRIORITY_RANKS[self.priority]
@@ -56,9 +82,13 @@ class Task:
         
     def mark_complete(self) -> None:
         self.completed = True
+        if self._observer is not None:
+            self._observer("task_completed", task=self)
 
     def mark_incomplete(self) -> None:
         self.completed = False
+        if self._observer is not None:
+            self._observer("task_reopened", task=self)
 
 
 @dataclass
@@ -66,9 +96,17 @@ class Pet:
     name: str
     species: str
     tasks: List[Task] = field(default_factory=list)
+    _observer: Optional[Callable[..., None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_task(self, task: Task) -> None:
+        self._append_task(task, "task_added")
+
+    def _append_task(self, task: Task, kind: str) -> None:
         self.tasks.append(task)
+        if self._observer is not None:
+            self._observer(kind, task=task)
 
     '''def remove_task(self, task_description: str) -> None:
         for task in self.tasks:
@@ -79,19 +117,40 @@ class Pet:
         for task in self.tasks:
             if task.number == task_number:
                 self.tasks.remove(task)
+                if self._observer is not None:
+                    self._observer("task_removed", task=task)
 
     def get_tasks(self) -> List[Task]:
         return self.tasks #list(self.tasks)
 
+    def import_tasks(
+        self, source: "ImportSource", fmt: Optional[str] = None, batch_size: int = 1000
+    ) -> "ImportReport":
+        """
+        Bulk-imports tasks for this pet from CSV or NDJSON (see import_tasks below).
+        Any pet_name column is ignored; every row belongs to this pet.
+        """
+        return import_tasks(source, lambda row: self, fmt, batch_size)
+
 
 @dataclass
 class Owner:
     name: str
     daily_time_available: int  # minutes
     pets: List[Pet] = field(default_factory=list)
+    _observer: Optional[Callable[..., None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_pet(self, pet: Pet) -> None:
         self.pets.append(pet)
+        if self._observer is not None:
+            self._observer("pet_added", pet=pet)
+
+    def set_daily_time_available(self, minutes: int) -> None:
+        self.daily_time_available = int(minutes)
+        if self._observer is not None:
+            self._observer("budget_changed", minutes=self.daily_time_available)
 
     def get_all_tasks(self) -> List[Task]:
         all_tasks: List[Task] = []
@@ -105,38 +164,42 @@ class Owner:
             tasks_by_pet[pet.name] = pet.get_tasks()
         return tasks_by_pet
 
+    def import_tasks(
+        self,
+        source: "ImportSource",
+        fmt: Optional[str] = None,
+        batch_size: int = 1000,
+        create_pets: bool = False,
+    ) -> "ImportReport":
+        """
+        Bulk-imports tasks from CSV or NDJSON, routed to pets by the pet_name column.
+        Rows naming an unknown pet are errors unless create_pets is True, in which
+        case the pet is added (species from the species column, default "Other").
+        """
+        pets_by_name = {pet.name: pet for pet in self.pets}
+        created: List[Pet] = []
+
+        def resolve_pet(row: dict) -> Pet:
+            name = str(row.get("pet_name") or "").strip()
+            if not name:
+                raise ValueError("pet_name is required")
+            pet = pets_by_name.get(name)
+            if pet is None:
+                if not create_pets:
+                    raise ValueError(f"unknown pet '{name}' for owner '{self.name}'")
+                pet = Pet(name, str(row.get("species") or "Other").strip() or "Other")
+                pets_by_name[name] = pet
+                created.append(pet)
+            return pet
+
+        report = import_tasks(source, resolve_pet, fmt, batch_size)
+        for pet in created:
+            self.add_pet(pet)
+        return report
+
     @classmethod
     def save_to_json(cls, owners: List["Owner"], file_path: str = "data.json") -> None:
-        data = {"owners": []}
-        for owner in owners:
-            owner_payload = {
-                "name": owner.name,
-                "daily_time_available": owner.daily_time_available,
-                "pets": [],
-            }
-            for pet in owner.pets:
-                pet_payload = {
-                    "name": pet.name,
-                    "species": pet.species,
-                    "tasks": [],
-                }
-                for task in pet.tasks:
-                    pet_payload["tasks"].append(
-                        {
-                            "number": task.number,
-                            "description": task.description,
-                            "duration_minutes": task.duration_minutes,
-                            "priority": task.priority,
-                            "time": task.time,
-                            "pet_name": task.pet_name,
-                            "frequency": task.frequency,
-                            "completed": task.completed,
-                            "due_date": task.due_date.isoformat(),
-                        }
-                    )
-                owner_payload["pets"].append(pet_payload)
-            data["owners"].append(owner_payload)
-
+        data = {"owners": [owner_to_dict(owner) for owner in owners]}
         Path(file_path).write_text(json.dumps(data, indent=2), encoding="utf-8")
 
     @classmethod
@@ -153,81 +216,206 @@ class Owner:
             payload = json.loads(raw)
         except json.JSONDecodeError:
             return []
-        owners: List[Owner] = []
-        max_task_number = 0
-
-        for owner_data in payload.get("owners", []):
-            owner = Owner(
-                name=owner_data.get("name", ""),
-                daily_time_available=int(owner_data.get("daily_time_available", 0)),
-            )
-            for pet_data in owner_data.get("pets", []):
-                pet = Pet(
-                    name=pet_data.get("name", ""),
-                    species=pet_data.get("species", "Other"),
-                )
-                for task_data in pet_data.get("tasks", []):
-                    due_date_raw = task_data.get("due_date", date.today().isoformat())
-                    try:
-                        due_date_value = date.fromisoformat(due_date_raw)
-                    except ValueError:
-                        due_date_value = date.today()
-
-                    task = Task(
-                        description=task_data.get("description", ""),
-                        duration_minutes=int(task_data.get("duration_minutes", 0)),
-                        priority=task_data.get("priority", "low"),
-                        time=int(task_data.get("time", 0)),
-                        pet_name=task_data.get("pet_name", pet.name),
-                        frequency=task_data.get("frequency", "daily"),
-                        completed=bool(task_data.get("completed", False)),
-                        due_date=due_date_value,
-                    )
-                    task.number = int(task_data.get("number", task.number))
-                    max_task_number = max(max_task_number, task.number)
-                    pet.add_task(task)
-                owner.add_pet(pet)
-            owners.append(owner)
-
-        Task._counter = max(Task._counter, max_task_number)
-        return owners
+        return [owner_from_dict(owner_data) for owner_data in payload.get("owners", [])]
+
+
+# -------------------------
+# JSON Payload Helpers
+# -------------------------
+
+def task_to_dict(task: Task) -> dict:
+    return {
+        "number": task.number,
+        "description": task.description,
+        "duration_minutes": task.duration_minutes,
+        "priority": task.priority,
+        "time": task.time,
+        "pet_name": task.pet_name,
+        "frequency": task.frequency,
+        "completed": task.completed,
+        "due_date": task.due_date.isoformat(),
+    }
+
+
+def pet_to_dict(pet: Pet) -> dict:
+    return {
+        "name": pet.name,
+        "species": pet.species,
+        "tasks": [task_to_dict(task) for task in pet.tasks],
+    }
+
+
+def owner_to_dict(owner: Owner) -> dict:
+    return {
+        "name": owner.name,
+        "daily_time_available": owner.daily_time_available,
+        "pets": [pet_to_dict(pet) for pet in owner.pets],
+    }
+
+
+def task_from_dict(task_data: dict, pet_name: str = "") -> Task:
+    due_date_raw = task_data.get("due_date", date.today().isoformat())
+    try:
+        due_date_value = date.fromisoformat(due_date_raw)
+    except ValueError:
+        due_date_value = date.today()
+
+    task = Task(
+        description=task_data.get("description", ""),
+        duration_minutes=int(task_data.get("duration_minutes", 0)),
+        priority=task_data.get("priority", "low"),
+        time=int(task_data.get("time", 0)),
+        pet_name=task_data.get("pet_name", pet_name),
+        frequency=task_data.get("frequency", "daily"),
+        completed=bool(task_data.get("completed", False)),
+        due_date=due_date_value,
+    )
+    task.number = int(task_data.get("number", task.number))
+    # new tasks must not reuse loaded numbers
+    Task._counter = max(Task._counter, task.number)
+    return task
+
+
+def pet_from_dict(pet_data: dict) -> Pet:
+    pet = Pet(
+        name=pet_data.get("name", ""),
+        species=pet_data.get("species", "Other"),
+    )
+    for task_data in pet_data.get("tasks", []):
+        pet.add_task(task_from_dict(task_data, pet.name))
+    return pet
+
+
+def owner_from_dict(owner_data: dict) -> Owner:
+    owner = Owner(
+        name=owner_data.get("name", ""),
+        daily_time_available=int(owner_data.get("daily_time_available", 0)),
+    )
+    for pet_data in owner_data.get("pets", []):
+        owner.add_pet(pet_from_dict(pet_data))
+    return owner
+
+
 # -------------------------
 # Scheduling Logic
 # -------------------------
 
+class PlanReason(Enum):
+    SCHEDULED = "scheduled"
+    ALREADY_COMPLETED = "already completed"
+    NOT_ENOUGH_TIME = "not enough time"
+
+
+class PlanDecision(NamedTuple):
+    task_number: int
+    decision: str  # "scheduled" or "skipped"
+    reason: PlanReason
+    remaining_minutes: int  # minutes left after this decision
+    task: Task
+
+    def render(self) -> str:
+        if self.reason is PlanReason.SCHEDULED:
+            return f"Scheduled '{self.task.description}' (priority {self.task.priority_label})."
+        return f"Skipped '{self.task.description}' ({self.reason.value})."
+
+
+class PlanExplanation(Sequence[str]):
+    """
+    Explanation lines for a plan, stored as PlanDecision records.
+    Text is only built when a line is read, so iterating it gives the same
+    strings generate_plan used to return while unread lines cost nothing.
+    """
+
+    def __init__(
+        self, records: List[PlanDecision], completed_skipped: int = 0, aggregate: bool = False
+    ) -> None:
+        self.records = records
+        # completed tasks left out of records (see generate_plan's completed_skips)
+        self.completed_skipped = completed_skipped
+        self._summary_line = aggregate and completed_skipped > 0
+
+    def __len__(self) -> int:
+        return len(self.records) + self._summary_line
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("explanation index out of range")
+        if index == len(self.records) and self._summary_line:
+            noun = "task" if self.completed_skipped == 1 else "tasks"
+            return f"{self.completed_skipped} completed {noun} skipped."
+        return self.records[index].render()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (PlanExplanation, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PlanExplanation({list(self)!r})"
+
+
 class Scheduler:
-    def generate_plan(self, owner: Owner) -> Tuple[List[Task], List[str]]:
+    def __init__(self) -> None:
+        # called as listener(completed_task, next_task); next_task is None for non-recurring tasks
+        self._completion_listeners: List[Callable[[Task, Optional[Task]], None]] = []
+
+    def add_completion_listener(self, listener: Callable[[Task, Optional[Task]], None]) -> None:
+        self._completion_listeners.append(listener)
+
+    def generate_plan(
+        self, owner: Owner, completed_skips: str = "itemize"
+    ) -> Tuple[List[Task], PlanExplanation]:
         """
         Returns:
         - plan: tasks selected for today
-        - explanation: reasons why tasks were selected or skipped
+        - explanation: reasons why tasks were selected or skipped, one per line
+
+        completed_skips controls completed tasks in the explanation:
+        - "itemize": one "already completed" line per task (default)
+        - "aggregate": a single "N completed tasks skipped." line at the end
+        - "suppress": no line; the count is still on explanation.completed_skipped
         """
+        if completed_skips not in ("itemize", "aggregate", "suppress"):
+            raise ValueError(f"Unknown completed_skips mode: {completed_skips!r}")
+
         available_minutes = owner.daily_time_available
-        explanation: List[str] = []
+        records: List[PlanDecision] = []
         selected: List[Task] = []
 
         tasks = owner.get_all_tasks()
+        completed_skipped = 0
+        if completed_skips != "itemize":
+            pending = [t for t in tasks if not t.completed]
+            completed_skipped = len(tasks) - len(pending)
+            tasks = pending
         # sort by priority (high to low), then by start time (earlier first)
         tasks.sort(key=lambda t: (-t.priority_rank, t.time))
 
         for task in tasks:
             
             if task.completed:
-                explanation.append(
-                    f"Skipped '{task.description}' (already completed)."
-                )
+                records.append(PlanDecision(
+                    task.number, "skipped", PlanReason.ALREADY_COMPLETED, available_minutes, task
+                ))
                 continue
             if task.duration_minutes > available_minutes:
-                explanation.append(
-                    f"Skipped '{task.description}' (not enough time)."
-                )
+                records.append(PlanDecision(
+                    task.number, "skipped", PlanReason.NOT_ENOUGH_TIME, available_minutes, task
+                ))
                 continue
             selected.append(task)
             available_minutes -= task.duration_minutes
-            explanation.append(
-                f"Scheduled '{task.description}' (priority {task.priority_label})."
-            )
+            records.append(PlanDecision(
+                task.number, "scheduled", PlanReason.SCHEDULED, available_minutes, task
+            ))
 
+        explanation = PlanExplanation(
+            records, completed_skipped, aggregate=completed_skips == "aggregate"
+        )
         return selected, explanation
     
     def sort_by_time(self, tasks: List[Task]) -> List[Task]:
@@ -246,6 +434,7 @@ class Scheduler:
             for task in pet.tasks:
                 if task.number == task_number:
                     task.mark_complete()
+                    new_task = None
 
                     # Create next occurrence for recurring tasks
                     if task.frequency in ("daily", "weekly"):
@@ -262,8 +451,10 @@ class Scheduler:
                             completed=False,
                             due_date=next_due,
                         )
-                        pet.add_task(new_task)
+                        pet._append_task(new_task, "recurrence_created")
 
+                    for listener in self._completion_listeners:
+                        listener(task, new_task)
                     return True
         return False
     
@@ -293,3 +484,220 @@ class Scheduler:
                 )
 
         return warnings
+
+
+# -------------------------
+# Bulk Import
+# -------------------------
+
+ImportSource = Union[str, Path, Iterable[str]]
+
+FREQUENCIES = ("daily", "weekly", "monthly")
+
+
+@dataclass
+class ImportRowError:
+    row: int  # 1-based data row (CSV header excluded) or NDJSON line number
+    message: str
+
+
+@dataclass
+class ImportReport:
+    tasks: List[Task] = field(default_factory=list)
+    errors: List[ImportRowError] = field(default_factory=list)
+    pets: List[Pet] = field(default_factory=list)  # pets that received tasks
+
+    @property
+    def imported(self) -> int:
+        return len(self.tasks)
+
+
+def _read_import_rows(
+    source: ImportSource, fmt: Optional[str]
+) -> Iterator[Tuple[int, Union[dict, str]]]:
+    """
+    Streams (row number, row) pairs. A row that cannot be parsed at all comes
+    back as an error message string instead of a dict.
+    """
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if fmt is None:
+            suffix = path.suffix.lower()
+            if suffix == ".csv":
+                fmt = "csv"
+            elif suffix in (".ndjson", ".jsonl"):
+                fmt = "ndjson"
+            else:
+                raise ValueError(
+                    f"Cannot tell import format from '{path.name}'; pass fmt='csv' or 'ndjson'"
+                )
+        with path.open(encoding="utf-8", newline="") as handle:
+            yield from _read_import_rows(handle, fmt)
+        return
+
+    if fmt == "csv":
+        for row_number, row in enumerate(csv.DictReader(source), start=1):
+            yield row_number, row
+    elif fmt == "ndjson":
+        for row_number, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield row_number, f"invalid JSON: {exc.msg}"
+                continue
+            yield row_number, row if isinstance(row, dict) else "expected a JSON object"
+    else:
+        raise ValueError(f"Unknown import format: {fmt!r}")
+
+
+def _parse_int(field_name: str, value) -> int:
+    raw = str(value).strip()
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"{field_name} {raw!r} is not an integer") from None
+
+
+def _parse_start_time(value) -> int:
+    # accepts minutes since midnight or "HH:MM"
+    raw = str(value).strip()
+    if ":" in raw:
+        hours, minutes = raw.split(":", 1)
+        try:
+            hours, minutes = int(hours), int(minutes)
+        except ValueError:
+            raise ValueError(f"time {raw!r} is not HH:MM or minutes since midnight") from None
+        if not (0 <= hours <= 23 and 0 <= minutes <= 59):
+            raise ValueError(f"time {raw!r} is outside 00:00-23:59")
+        return hours * 60 + minutes
+    minute_of_day = _parse_int("time", raw)
+    if not 0 <= minute_of_day < 24 * 60:
+        raise ValueError(f"time {raw!r} is outside 00:00-23:59")
+    return minute_of_day
+
+
+def _parse_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    raw = str(value).strip().lower()
+    if raw in ("1", "true", "yes", "y"):
+        return True
+    if raw in ("", "0", "false", "no", "n"):
+        return False
+    raise ValueError(f"completed {value!r} is not a boolean")
+
+
+def _normalize_rows(
+    batch: List[Tuple[int, dict]],
+    resolve_pet: Callable[[dict], Pet],
+    priorities: Dict[str, str],
+    dates: Dict[str, date],
+    errors: List[ImportRowError],
+) -> List[Tuple[Pet, dict]]:
+    """
+    Validates one batch. Priorities and due dates repeat heavily in real
+    exports, so both go through caches shared across batches.
+    """
+    valid: List[Tuple[Pet, dict]] = []
+    today = date.today()
+    for row_number, row in batch:
+        try:
+            description = str(row.get("description") or "").strip()
+            if not description:
+                raise ValueError("description is required")
+            duration = _parse_int("duration_minutes", row.get("duration_minutes", ""))
+            if duration < 0:
+                raise ValueError("duration_minutes must not be negative")
+
+            raw_priority = str(row.get("priority") or "low")
+            priority = priorities.get(raw_priority)
+            if priority is None:
+                priority = priorities[raw_priority] = Task._normalize_priority(raw_priority)
+
+            frequency = str(row.get("frequency") or "daily").strip().lower()
+            if frequency not in FREQUENCIES:
+                raise ValueError(
+                    f"frequency {frequency!r} is not one of {', '.join(FREQUENCIES)}"
+                )
+
+            raw_due = str(row.get("due_date") or "").strip()
+            if raw_due:
+                due_date = dates.get(raw_due)
+                if due_date is None:
+                    try:
+                        due_date = dates[raw_due] = date.fromisoformat(raw_due)
+                    except ValueError:
+                        raise ValueError(
+                            f"due_date {raw_due!r} is not a YYYY-MM-DD date"
+                        ) from None
+            else:
+                due_date = today
+
+            start = _parse_start_time(row.get("time", ""))
+            completed = _parse_bool(row.get("completed", False))
+            # resolve last so a pet is only created for a row that is otherwise valid
+            pet = resolve_pet(row)
+            valid.append((pet, {
+                "description": description,
+                "duration_minutes": duration,
+                "priority": priority,
+                "time": start,
+                "pet_name": pet.name,
+                "frequency": frequency,
+                "completed": completed,
+                "due_date": due_date,
+            }))
+        except (TypeError, ValueError) as exc:
+            errors.append(ImportRowError(row_number, str(exc)))
+    return valid
+
+
+def import_tasks(
+    source: ImportSource,
+    resolve_pet: Callable[[dict], Pet],
+    fmt: Optional[str] = None,
+    batch_size: int = 1000,
+) -> ImportReport:
+    """
+    Streams rows from a CSV/NDJSON path, file or iterable of lines, validating
+    them batch_size at a time. Bad rows are reported in report.errors and do not
+    stop the import. Valid rows get one reserved block of task numbers and are
+    added to their pets together at the end, so the caller saves once.
+    """
+    report = ImportReport()
+    priorities: Dict[str, str] = {}
+    dates: Dict[str, date] = {}
+    valid: List[Tuple[Pet, dict]] = []
+
+    rows = _read_import_rows(source, fmt)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        parsed: List[Tuple[int, dict]] = []
+        for row_number, row in batch:
+            if isinstance(row, str):
+                report.errors.append(ImportRowError(row_number, row))
+            else:
+                parsed.append((row_number, row))
+        valid.extend(_normalize_rows(parsed, resolve_pet, priorities, dates, report.errors))
+
+    first_number = Task._reserve_numbers(len(valid))
+    new_tasks_by_pet: Dict[int, List[Task]] = {}
+    for offset, (pet, fields) in enumerate(valid):
+        task = Task._from_normalized(first_number + offset, **fields)
+        report.tasks.append(task)
+        if id(pet) not in new_tasks_by_pet:
+            new_tasks_by_pet[id(pet)] = []
+            report.pets.append(pet)
+        new_tasks_by_pet[id(pet)].append(task)
+
+    for pet in report.pets:
+        new_tasks = new_tasks_by_pet[id(pet)]
+        pet.tasks.extend(new_tasks)
+        if pet._observer is not None:
+            for task in new_tasks:
+                pet._observer("task_added", task=task)
+    return report
@@ -0,0 +1,60 @@
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pawpal_system import Owner, Pet, Task
+from pawpal_analytics import TaskTable
+
+
+def make_owners():
+    amelia = Owner("Amelia", 60)
+    luna = Pet("Luna", "Dog")
+    luna.add_task(Task("Walk", 30, "high", time=480, pet_name="Luna", due_date=date(2024, 5, 6), completed=True))
+    luna.add_task(Task("Walk", 30, "high", time=495, pet_name="Luna", due_date=date(2024, 5, 7)))
+    luna.add_task(Task("Bath", 45, "low", time=1080, pet_name="Luna", due_date=date(2024, 5, 14), frequency="monthly"))
+    amelia.add_pet(luna)
+
+    jordan = Owner("Jordan", 60)
+    milo = Pet("Milo", "Cat")
+    milo.add_task(Task("Feed", 5, "medium", time=420, pet_name="Milo", due_date=date(2024, 5, 8), completed=True))
+    jordan.add_pet(milo)
+    jordan.add_pet(luna)  # shared pet is counted once
+    return [amelia, jordan]
+
+
+def test_grouped_minutes_counts_and_completion():
+    table = TaskTable.from_owners(make_owners())
+
+    assert len(table) == 4
+    assert table.minutes_by("pet") == {"Luna (Amelia)": 105, "Milo (Jordan)": 5}
+    assert table.counts_by("species") == {"Dog": 3, "Cat": 1}
+    assert table.minutes_by("frequency", completed=False) == {"daily": 30, "monthly": 45}
+    assert table.completion_rate_by("priority") == {"low": 0.0, "medium": 1.0, "high": 0.5}
+    assert table.minutes_by("owner", start=date(2024, 5, 7), end=date(2024, 5, 8)) == {
+        "Amelia": 30,
+        "Jordan": 5,
+    }
+
+
+def test_weekly_minutes_and_start_time_histogram():
+    table = TaskTable.from_owners(make_owners())
+
+    assert table.weekly_minutes_by("pet") == {
+        ("Luna (Amelia)", date(2024, 5, 6)): 60,
+        ("Luna (Amelia)", date(2024, 5, 13)): 45,
+        ("Milo (Jordan)", date(2024, 5, 6)): 5,
+    }
+    hist = table.start_time_histogram()
+    assert len(hist) == 24
+    assert hist[7] == 1 and hist[8] == 2 and hist[18] == 1
+    assert hist.sum() == 4
+
+
+def test_empty_table():
+    table = TaskTable.from_owners([Owner("Amelia", 60)])
+
+    assert table.minutes_by("pet") == {}
+    assert table.weekly_minutes_by("pet") == {}
+    assert table.start_time_histogram(bin_minutes=90).tolist() == [0] * 16
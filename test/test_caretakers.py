@@ -0,0 +1,63 @@
+import pytest
+
+from pawpal_system import Owner, Pet, Task
+from pawpal_caretakers import Caretaker, CaretakerScheduler, pool_tasks
+
+
+def assert_no_overlaps(tasks):
+    ordered = sorted(tasks, key=lambda t: t.time)
+    for current, nxt in zip(ordered, ordered[1:]):
+        assert nxt.time >= current.time + current.duration_minutes
+
+
+def test_assignment_respects_budgets_and_avoids_overlaps():
+    tasks = [Task(f"Task {i}", 30, "medium", time=480 + 15 * i, pet_name="Luna") for i in range(8)]
+    caretakers = [Caretaker("Amelia", 60), Caretaker("Jordan", 90)]
+
+    result = CaretakerScheduler().assign(tasks, caretakers)
+
+    for caretaker in caretakers:
+        assigned = result.tasks_by_caretaker[caretaker.name]
+        assert sum(t.duration_minutes for t in assigned) <= caretaker.daily_time_available
+        assert_no_overlaps(assigned)
+    assigned_count = sum(len(v) for v in result.tasks_by_caretaker.values())
+    assert assigned_count + len(result.unassigned) == len(tasks)
+
+
+def test_working_window_is_respected():
+    early = Task("Early feed", 10, "high", time=360, pet_name="Luna")
+    late = Task("Late walk", 10, "high", time=1200, pet_name="Luna")
+    caretakers = [Caretaker("Morning", 120, 300, 720), Caretaker("Evening", 120, 1080, 1440)]
+
+    result = CaretakerScheduler().assign([early, late], caretakers)
+
+    assert result.tasks_by_caretaker["Morning"] == [early]
+    assert result.tasks_by_caretaker["Evening"] == [late]
+
+
+def test_load_is_balanced_across_caretakers():
+    tasks = [Task(f"Task {i}", 10, "low", time=60 * i, pet_name="Luna") for i in range(6)]
+    caretakers = [Caretaker("A", 120), Caretaker("B", 120), Caretaker("C", 120)]
+
+    result = CaretakerScheduler().assign(tasks, caretakers)
+
+    assert sorted(result.minutes_used.values()) == [20, 20, 20]
+    assert result.unassigned == []
+
+
+def test_duplicate_caretaker_names_are_rejected():
+    tasks = [Task("Walk", 10, "low", time=480, pet_name="Luna")]
+
+    with pytest.raises(ValueError):
+        CaretakerScheduler().assign(tasks, [Caretaker("A", 60), Caretaker("A", 30)])
+
+
+def test_pool_tasks_counts_shared_pets_once():
+    shared = Pet("Luna", "Dog")
+    shared.add_task(Task("Walk", 20, "high", time=480, pet_name="Luna"))
+    done = Task("Feed", 5, "high", time=500, pet_name="Luna", completed=True)
+    shared.add_task(done)
+    amelia = Owner("Amelia", 60, pets=[shared])
+    jordan = Owner("Jordan", 60, pets=[shared])
+
+    assert [t.description for t in pool_tasks([amelia, jordan])] == ["Walk"]
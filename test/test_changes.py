@@ -0,0 +1,87 @@
+from datetime import date
+
+from pawpal_system import Owner, Pet, Scheduler, Task, owner_to_dict
+from pawpal_changes import ChangeFeed, apply_delta, load_delta
+
+
+def make_owner():
+    owner = Owner("Amelia", daily_time_available=60)
+    pet = Pet("Luna", "Dog")
+    pet.add_task(Task("Walk", 20, "high", time=480, pet_name="Luna", due_date=date(2024, 5, 1)))
+    owner.add_pet(pet)
+    return owner
+
+
+def test_every_mutation_gets_a_new_version():
+    owner = make_owner()
+    feed = ChangeFeed([owner])
+    walk = owner.pets[0].tasks[0]
+
+    owner.set_daily_time_available(90)
+    owner.add_pet(Pet("Milo", "Cat"))
+    owner.pets[1].add_task(Task("Feed", 5, "low", time=500, pet_name="Milo"))
+    Scheduler().mark_task_complete(owner, walk.number)
+    feed.add_owner(Owner("Jordan", daily_time_available=30))
+
+    changes = feed.changes_since(0)
+    assert [c.kind for c in changes] == [
+        "budget_changed",
+        "pet_added",
+        "task_added",
+        "task_completed",
+        "recurrence_created",
+        "owner_added",
+    ]
+    assert [c.version for c in changes] == [1, 2, 3, 4, 5, 6]
+    assert [c.kind for c in feed.changes_since(4)] == ["recurrence_created", "owner_added"]
+
+
+def test_replica_catches_up_from_delta_file(tmp_path):
+    owner = make_owner()
+    feed = ChangeFeed([owner])
+    replica = apply_delta([], feed.delta_since(0, epoch="someone-else"))  # initial sync
+
+    owner.pets[0].add_task(Task("Brush", 10, "low", time=600, pet_name="Luna"))
+    owner.pets[0].remove_task(owner.pets[0].tasks[0].number)
+    owner.set_daily_time_available(45)
+
+    delta = feed.export_delta(0, tmp_path / "delta.json", epoch=feed.epoch)
+    assert delta["checkpoint"] is None
+    assert len(delta["changes"]) == 3
+
+    replica = apply_delta(replica, load_delta(tmp_path / "delta.json"))
+    assert [owner_to_dict(o) for o in replica] == [owner_to_dict(owner)]
+
+
+def test_old_versions_get_a_checkpoint():
+    owner = make_owner()
+    feed = ChangeFeed([owner], checkpoint_every=2)
+    for minutes in range(10, 70, 10):
+        owner.set_daily_time_available(minutes)
+
+    assert feed.version == 6
+    assert feed.changes_since(1) is None
+    delta = feed.delta_since(1)
+    assert delta["checkpoint"] is not None
+    assert [owner_to_dict(o) for o in apply_delta([], delta)] == [owner_to_dict(owner)]
+
+
+def test_shared_pet_changes_reach_every_owner():
+    amelia = make_owner()
+    jordan = Owner("Jordan", daily_time_available=30)
+    luna = amelia.pets[0]
+    jordan.add_pet(luna)
+    feed = ChangeFeed([amelia, jordan])
+    replica = apply_delta([], feed.delta_since(0, epoch="someone-else"))
+
+    luna.add_task(Task("Brush", 10, "low", time=600, pet_name="Luna"))
+    Scheduler().mark_task_complete(amelia, luna.tasks[0].number)
+
+    replica = apply_delta(replica, feed.delta_since(0, epoch=feed.epoch))
+    assert [owner_to_dict(o) for o in replica] == [owner_to_dict(amelia), owner_to_dict(jordan)]
+
+    feed.remove_owner("Amelia")
+    luna.remove_task(luna.tasks[0].number)
+    assert [(c.kind, c.owner) for c in feed.changes_since(feed.version - 1)] == [
+        ("task_removed", "Jordan")
+    ]
@@ -0,0 +1,47 @@
+import random
+
+from pawpal_system import Task
+import pawpal_difftest
+from pawpal_difftest import build_owners, generate_scenario, register, run, unregister
+
+
+def test_registered_candidates_match_reference():
+    mismatches = run(scenarios=100, seed=1234)
+
+    assert mismatches == [], "\n\n".join(str(m) for m in mismatches)
+
+
+def test_broken_candidate_is_reported_with_minimized_input():
+    def off_by_one_plan(owner):
+        # bug: a task that exactly fills the remaining time is skipped
+        remaining = owner.daily_time_available
+        plan = []
+        for task in sorted(owner.get_all_tasks(), key=lambda t: (-t.priority_rank, t.time)):
+            if not task.completed and task.duration_minutes < remaining:
+                plan.append(task)
+                remaining -= task.duration_minutes
+        return plan, pawpal_difftest.REFERENCE["generate_plan"](owner)[1]
+
+    register("generate_plan", "off by one", off_by_one_plan)
+    try:
+        mismatches = run(scenarios=100, seed=0, kinds=("generate_plan",))
+    finally:
+        unregister("generate_plan", "off by one")
+
+    assert len(mismatches) == 1
+    small = mismatches[0].scenario
+    assert len(small.owners) == 1
+    assert sum(len(p["tasks"]) for p in small.owners[0]["pets"]) == 1
+    assert "off by one" in str(mismatches[0])
+
+
+def test_build_owners_is_repeatable_and_keeps_counter_moving_forward():
+    scenario = generate_scenario(random.Random(7))
+    before = Task(".", 1, 1, time=0, pet_name="x").number
+
+    first = build_owners(scenario)
+    second = build_owners(scenario)
+
+    numbers = lambda owners: [t.number for o in owners for t in o.get_all_tasks()]
+    assert numbers(first) == numbers(second)
+    assert Task(".", 1, 1, time=0, pet_name="x").number > before
@@ -1,6 +1,7 @@
+from collections.abc import Sequence
 from datetime import date, timedelta
 import pytest
-from pawpal_system import Owner, Pet, Task, Scheduler
+from pawpal_system import Owner, Pet, Task, Scheduler, PlanReason
 
 
 def test_ordering_by_priority_then_duration():
@@ -44,7 +45,8 @@ def test_empty_tasks_returns_empty_plan():
     plan, explanation = Scheduler().generate_plan(owner)
 
     assert plan == []
-    assert isinstance(explanation, list)
+    assert isinstance(explanation, Sequence)
+    assert len(explanation) == 0
 
 
 def test_empty_time_available_returns_empty_plan():
@@ -77,6 +79,52 @@ def test_completed_tasks_are_skipped():
     assert any("already completed" in line for line in explanation)
 
 
+def test_explanation_records_render_same_text():
+    owner = Owner("Amelia", daily_time_available=20)
+    pet = Pet("Luna", "Dog")
+    walk = Task("Walk", 15, "high", time=480, pet_name="Luna")
+    feed = Task("Feed", 10, "medium", time=500, pet_name="Luna")
+    pet.add_task(walk)
+    pet.add_task(feed)
+    owner.add_pet(pet)
+
+    _, explanation = Scheduler().generate_plan(owner)
+
+    assert [(r.task_number, r.decision, r.reason, r.remaining_minutes) for r in explanation.records] == [
+        (walk.number, "scheduled", PlanReason.SCHEDULED, 5),
+        (feed.number, "skipped", PlanReason.NOT_ENOUGH_TIME, 5),
+    ]
+    assert list(explanation) == [
+        "Scheduled 'Walk' (priority High).",
+        "Skipped 'Feed' (not enough time).",
+    ]
+    assert explanation[-1] == "Skipped 'Feed' (not enough time)."
+    with pytest.raises(IndexError):
+        explanation[-3]
+    with pytest.raises(IndexError):
+        explanation[2]
+
+
+def test_completed_skips_can_be_aggregated_or_suppressed():
+    owner = Owner("Amelia", daily_time_available=30)
+    pet = Pet("Luna", "Dog")
+    for i in range(3):
+        pet.add_task(Task(f"Old walk {i}", 15, "high", time=480, pet_name="Luna", completed=True))
+    pet.add_task(Task("Feed", 5, "low", time=500, pet_name="Luna"))
+    owner.add_pet(pet)
+
+    plan, aggregated = Scheduler().generate_plan(owner, completed_skips="aggregate")
+    _, suppressed = Scheduler().generate_plan(owner, completed_skips="suppress")
+
+    assert [t.description for t in plan] == ["Feed"]
+    assert list(aggregated) == [
+        "Scheduled 'Feed' (priority Low).",
+        "3 completed tasks skipped.",
+    ]
+    assert list(suppressed) == ["Scheduled 'Feed' (priority Low)."]
+    assert suppressed.completed_skipped == 3
+
+
 def test_task_numbers_are_unique_across_instances():
     t1 = Task("A", 5, 1, time=480, pet_name="Luna")
     t2 = Task("B", 5, 1, time=490, pet_name="Luna")
@@ -153,3 +201,52 @@ def test_detect_conflicts_flags_same_start_time():
 
     assert len(warnings) == 1
     assert "Time conflict" in warnings[0]
+
+
+def test_bulk_import_csv_reports_bad_rows_and_reserves_numbers():
+    owner = Owner("Amelia", daily_time_available=60)
+    owner.add_pet(Pet("Luna", "Dog"))
+    rows = [
+        "description,duration_minutes,priority,time,pet_name,frequency,due_date,completed",
+        "Walk,20,High,08:00,Luna,daily,2024-05-01,false",
+        "Feed,5,4,510,Luna,weekly,,",
+        "Nap,abc,low,09:00,Luna,daily,,",           # bad duration
+        "Play,10,low,25:00,Luna,daily,,",           # bad time
+        "Groom,15,medium,600,Ghost,daily,,",        # unknown pet
+        "Brush,5,low,8:-5,Luna,daily,,",            # negative minutes
+        "Treat,5,low,8:75,Luna,daily,,",            # minutes past 59
+        "Sniff,,low,600,Luna,daily,,",              # missing duration
+        "Bath,30,low,600,Luna,daily,2024-13-01,",   # bad due date
+    ]
+    before = Task(".", 1, 1, time=0, pet_name="x").number
+
+    report = owner.import_tasks(rows, fmt="csv", batch_size=2)
+    after = Task(".", 1, 1, time=0, pet_name="x").number
+
+    assert [t.description for t in owner.pets[0].tasks] == ["Walk", "Feed"]
+    assert [(t.priority, t.time, t.frequency) for t in report.tasks] == [
+        ("high", 480, "daily"),
+        ("high", 510, "weekly"),
+    ]
+    assert report.tasks[0].due_date == date(2024, 5, 1)
+    assert [e.row for e in report.errors] == [3, 4, 5, 6, 7, 8, 9]
+    assert report.errors[0].message == "duration_minutes 'abc' is not an integer"
+    assert report.errors[5].message == "duration_minutes '' is not an integer"
+    assert report.errors[6].message == "due_date '2024-13-01' is not a YYYY-MM-DD date"
+    assert [t.number for t in report.tasks] == [before + 1, before + 2]
+    assert after == before + 3
+
+
+def test_bulk_import_ndjson_can_create_pets():
+    owner = Owner("Amelia", daily_time_available=60)
+    lines = [
+        '{"description": "Walk", "duration_minutes": 20, "priority": "high", "time": 480, "pet_name": "Luna", "species": "Dog"}',
+        "not json",
+        '{"description": "Feed", "duration_minutes": 5, "time": "07:30", "pet_name": "Milo", "species": "Cat"}',
+    ]
+
+    report = owner.import_tasks(lines, fmt="ndjson", create_pets=True)
+
+    assert report.imported == 2
+    assert [e.row for e in report.errors] == [2]
+    assert [(p.name, p.species, len(p.tasks)) for p in owner.pets] == [("Luna", "Dog", 1), ("Milo", "Cat", 1)]
@@ -0,0 +1,102 @@
+import asyncio
+from datetime import date, datetime, timedelta
+
+from pawpal_system import Owner, Pet, Scheduler, Task
+from pawpal_reminders import ReminderDispatcher
+
+DAY = date(2024, 5, 1)
+MORNING = datetime(2024, 5, 1, 7, 0)
+
+
+def test_reminders_fire_lead_minutes_before_start_in_order():
+    dispatcher = ReminderDispatcher(lead_minutes=10, clock=lambda: MORNING)
+    walk = Task("Walk", 20, "high", time=480, pet_name="Luna", due_date=DAY)   # 08:00
+    feed = Task("Feed", 5, "high", time=450, pet_name="Luna", due_date=DAY)    # 07:30
+    done = Task("Meds", 5, "high", time=500, pet_name="Luna", due_date=DAY, completed=True)
+
+    assert dispatcher.schedule(walk).fire_at == datetime(2024, 5, 1, 7, 50)
+    dispatcher.schedule(feed)
+    assert dispatcher.schedule(done) is None
+
+    assert dispatcher.pop_due(datetime(2024, 5, 1, 7, 19)) == []
+    assert [r.task.description for r in dispatcher.pop_due(datetime(2024, 5, 1, 8, 0))] == [
+        "Feed",
+        "Walk",
+    ]
+    assert len(dispatcher) == 0
+
+
+def test_cancel_drops_pending_reminder():
+    dispatcher = ReminderDispatcher(lead_minutes=10, clock=lambda: MORNING)
+    walk = Task("Walk", 20, "high", time=480, pet_name="Luna", due_date=DAY)
+    dispatcher.schedule(walk)
+
+    assert dispatcher.cancel(walk.number) is True
+    assert dispatcher.cancel(walk.number) is False
+    assert dispatcher.next_fire_at() is None
+    assert dispatcher.pop_due(datetime(2024, 5, 2)) == []
+
+
+def test_completing_recurring_task_reschedules_next_occurrence():
+    owner = Owner("Amelia", daily_time_available=60)
+    pet = Pet("Luna", "Dog")
+    walk = Task("Walk", 20, "high", time=480, pet_name="Luna", due_date=DAY)
+    pet.add_task(walk)
+    owner.add_pet(pet)
+
+    scheduler = Scheduler()
+    dispatcher = ReminderDispatcher(lead_minutes=10, clock=lambda: MORNING)
+    dispatcher.attach(scheduler)
+    assert dispatcher.schedule_owner(owner) == 1
+
+    scheduler.mark_task_complete(owner, walk.number)
+
+    assert len(dispatcher) == 1
+    assert dispatcher.next_fire_at() == datetime(2024, 5, 2, 7, 50)
+
+
+def test_run_awaits_async_callbacks():
+    soon = datetime.now() + timedelta(minutes=2)
+    task = Task(
+        "Walk", 20, "high", time=soon.hour * 60 + soon.minute, pet_name="Luna",
+        due_date=soon.date(),
+    )
+    fired = []
+
+    async def scenario():
+        dispatcher = ReminderDispatcher(lead_minutes=15)
+
+        async def remember(reminder):
+            fired.append(reminder.task.number)
+            dispatcher.stop()
+
+        dispatcher.on_reminder(remember)
+        runner = asyncio.create_task(dispatcher.run())
+        await asyncio.sleep(0)
+        dispatcher.schedule(task)  # already inside the lead window, so it fires right away
+        await asyncio.wait_for(runner, timeout=1)
+
+    asyncio.run(scenario())
+    assert fired == [task.number]
+
+
+def test_failing_callback_does_not_drop_rest_of_batch(caplog):
+    dispatcher = ReminderDispatcher(lead_minutes=10, clock=lambda: MORNING)
+    walk = Task("Walk", 20, "high", time=480, pet_name="Luna", due_date=DAY)
+    feed = Task("Feed", 5, "high", time=450, pet_name="Luna", due_date=DAY)
+    dispatcher.schedule(walk)
+    dispatcher.schedule(feed)
+    fired = []
+
+    def broken(reminder):
+        raise RuntimeError("hook failed")
+
+    dispatcher.on_reminder(broken)
+    dispatcher.on_reminder(lambda reminder: fired.append(reminder.task.description))
+
+    due = asyncio.run(dispatcher.dispatch_due(datetime(2024, 5, 1, 8, 0)))
+
+    assert [r.task.description for r in due] == ["Feed", "Walk"]
+    assert fired == ["Feed", "Walk"]
+    assert len(dispatcher) == 0
+    assert "hook failed" in caplog.text
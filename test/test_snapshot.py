@@ -0,0 +1,85 @@
+import os
+from datetime import date
+
+import pytest
+from pawpal_system import Owner, Pet, Task
+from pawpal_snapshot import Snapshot, load_owners, save_owners, snapshot_path_for, write_snapshot
+
+
+def make_owners():
+    owner = Owner("Amelia", daily_time_available=90)
+    dog = Pet("Luna", "Dog")
+    cat = Pet("Milo", "Cat")
+    dog.add_task(Task("Walk", 20, "high", time=480, pet_name="Luna", due_date=date(2024, 5, 1)))
+    dog.add_task(Task("Brush", 10, "low", time=600, pet_name="Luna", frequency="weekly"))
+    cat.add_task(Task("Feed", 5, "medium", time=500, pet_name="Milo", completed=True))
+    owner.add_pet(dog)
+    owner.add_pet(cat)
+    return [owner, Owner("Jordan", daily_time_available=0)]
+
+
+def as_rows(owners):
+    return [
+        (
+            o.name,
+            o.daily_time_available,
+            [
+                (
+                    p.name,
+                    p.species,
+                    [
+                        (t.number, t.description, t.duration_minutes, t.priority, t.time,
+                         t.pet_name, t.frequency, t.completed, t.due_date)
+                        for t in p.tasks
+                    ],
+                )
+                for p in o.pets
+            ],
+        )
+        for o in owners
+    ]
+
+
+def test_snapshot_round_trip_matches_original(tmp_path):
+    owners = make_owners()
+    write_snapshot(owners, tmp_path / "data.pawsnap")
+
+    with Snapshot(tmp_path / "data.pawsnap") as snapshot:
+        assert snapshot.owner_names() == ["Amelia", "Jordan"]
+        assert snapshot.owner_summary(0) == ("Amelia", 90, 2)
+        assert as_rows(snapshot.load_owners()) == as_rows(owners)
+
+
+def test_warm_start_skips_json_parsing(tmp_path, monkeypatch):
+    json_path = tmp_path / "data.json"
+    owners = make_owners()
+    save_owners(owners, json_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("JSON should not be parsed on a warm start")
+
+    monkeypatch.setattr(Owner, "load_from_json", fail)
+    assert as_rows(load_owners(json_path)) == as_rows(owners)
+
+
+def test_changed_json_rebuilds_snapshot(tmp_path):
+    json_path = tmp_path / "data.json"
+    save_owners(make_owners(), json_path)
+
+    # edit the interchange file behind the cache's back
+    Owner.save_to_json([Owner("Sam", daily_time_available=45)], str(json_path))
+    stat = json_path.stat()
+    os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    loaded = load_owners(json_path)
+    assert [(o.name, o.daily_time_available) for o in loaded] == [("Sam", 45)]
+
+
+def test_corrupt_snapshot_falls_back_to_json(tmp_path):
+    json_path = tmp_path / "data.json"
+    save_owners(make_owners(), json_path)
+    snapshot_path_for(json_path).write_bytes(b"\x00" * 128)
+
+    with pytest.raises(ValueError):
+        Snapshot(snapshot_path_for(json_path))
+    assert [o.name for o in load_owners(json_path)] == ["Amelia", "Jordan"]
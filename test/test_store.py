@@ -0,0 +1,97 @@
+from pawpal_changes import apply_delta
+from pawpal_system import Owner, Pet, Task, owner_to_dict
+from pawpal_snapshot import save_owners
+from pawpal_store import OwnerStore
+
+
+def seed(json_path):
+    owners = []
+    for name in ("Amelia", "Jordan", "Sam"):
+        owner = Owner(name, daily_time_available=60)
+        pet = Pet(f"{name}'s dog", "Dog")
+        pet.add_task(Task("Walk", 20, "high", time=480, pet_name=pet.name))
+        owner.add_pet(pet)
+        owners.append(owner)
+    save_owners(owners, json_path)
+
+
+def test_owners_are_loaded_only_when_opened(tmp_path):
+    json_path = tmp_path / "data.json"
+    seed(json_path)
+
+    store = OwnerStore(json_path)
+
+    assert store.names() == ["Amelia", "Jordan", "Sam"]
+    assert store.summary("Jordan") == (60, 1)
+    assert not any(store.is_loaded(name) for name in store.names())
+
+    jordan = store.get("Jordan")
+    assert [p.name for p in jordan.pets] == ["Jordan's dog"]
+    assert store.is_loaded("Jordan") and not store.is_loaded("Amelia")
+    assert store.get("Jordan") is jordan
+    store.close()
+
+
+def test_save_keeps_unopened_owners(tmp_path):
+    json_path = tmp_path / "data.json"
+    seed(json_path)
+    store = OwnerStore(json_path)
+    store.get("Amelia").set_daily_time_available(90)
+    store.add(Owner("Riley", daily_time_available=30))
+
+    store.save()
+
+    reopened = OwnerStore(json_path)
+    assert reopened.names() == ["Amelia", "Jordan", "Sam", "Riley"]
+    assert reopened.summary("Amelia") == (90, 1)
+    assert len(reopened.get("Sam").get_all_tasks()) == 1
+    reopened.close()
+
+
+def test_missing_data_file_gives_empty_store(tmp_path):
+    store = OwnerStore(tmp_path / "data.json")
+
+    assert len(store) == 0
+    store.add(Owner("Amelia", daily_time_available=60))
+    assert "Amelia" in store
+    store.save()
+    assert (tmp_path / "data.json").exists()
+
+
+def test_change_feed_survives_restart(tmp_path):
+    json_path = tmp_path / "data.json"
+    seed(json_path)
+    store = OwnerStore(json_path)
+    replica = apply_delta([], store.feed.delta_since(0, epoch="new replica"))
+    synced, epoch = store.feed.version, store.feed.epoch
+    assert not any(store.is_loaded(name) for name in store.names())
+
+    store.get("Amelia").set_daily_time_available(90)
+    store.save()
+
+    reopened = OwnerStore(json_path)
+    reopened.get("Jordan").pets[0].add_task(Task("Feed", 5, "low", time=500, pet_name="Jordan's dog"))
+    reopened.add(Owner("Riley", daily_time_available=30))
+
+    delta = reopened.feed.delta_since(synced, epoch)
+    assert reopened.feed.epoch == epoch
+    assert delta["checkpoint"] is None
+    assert [c["kind"] for c in delta["changes"]] == ["budget_changed", "task_added", "owner_added"]
+    replica = apply_delta(replica, delta)
+    assert [owner_to_dict(o) for o in replica] == [owner_to_dict(o) for o in reopened.all()]
+    reopened.close()
+
+
+def test_feed_restarts_when_data_file_changed_elsewhere(tmp_path):
+    json_path = tmp_path / "data.json"
+    seed(json_path)
+    store = OwnerStore(json_path)
+    store.save()
+    epoch = store.feed.epoch
+
+    save_owners([Owner("Sam", daily_time_available=10)], json_path)  # edited outside the store
+
+    reopened = OwnerStore(json_path)
+    assert reopened.feed.epoch != epoch
+    assert reopened.feed.delta_since(0, epoch)["checkpoint"] == [owner_to_dict(reopened.get("Sam"))]
+    reopened.close()
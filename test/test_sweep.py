@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pawpal_system import Owner, Pet, Scheduler, Task
+from pawpal_sweep import sweep_budgets
+
+
+def make_owner(seed, count=40, durations=(0, 5, 10, 15, 30, 45, 60, 90)):
+    rng = random.Random(seed)
+    owner = Owner("Amelia", daily_time_available=0)
+    pet = Pet("Luna", "Dog")
+    for i in range(count):
+        pet.add_task(
+            Task(
+                f"Task {i}",
+                rng.choice(durations),
+                rng.randint(1, 5),
+                time=rng.randrange(0, 1440, 15),
+                pet_name="Luna",
+                completed=rng.random() < 0.2,
+            )
+        )
+    owner.add_pet(pet)
+    return owner
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+# without zero-length tasks the early exit is actually reached
+@pytest.mark.parametrize("durations", [(0, 5, 10, 15, 30, 45, 60, 90), (5, 10, 15, 30, 45)])
+def test_sweep_matches_generate_plan_for_every_budget(seed, durations):
+    owner = make_owner(seed, durations=durations)
+    sweep = sweep_budgets(owner)
+    scheduler = Scheduler()
+
+    for budget in range(0, 1441):
+        owner.daily_time_available = budget
+        plan, explanation = scheduler.generate_plan(owner)
+        outcome = sweep.at(budget)
+        skipped = [r.task_number for r in explanation.records if r.reason.value == "not enough time"]
+
+        assert outcome.scheduled == len(plan)
+        assert outcome.minutes_used == sum(t.duration_minutes for t in plan)
+        assert outcome.marginal_task == (skipped[0] if skipped else None)
+        assert sweep.plan_at(budget) == plan
+
+
+def test_sweep_accepts_budget_list():
+    owner = Owner("Amelia", daily_time_available=0)
+    pet = Pet("Luna", "Dog")
+    walk = Task("Walk", 30, "high", time=480, pet_name="Luna")
+    feed = Task("Feed", 10, "low", time=500, pet_name="Luna")
+    pet.add_task(walk)
+    pet.add_task(feed)
+    owner.add_pet(pet)
+
+    sweep = sweep_budgets(owner, [90, 30, 20])
+
+    assert sweep.budgets.tolist() == [20, 30, 90]
+    assert sweep.scheduled.tolist() == [1, 1, 2]
+    assert sweep.minutes_used.tolist() == [10, 30, 40]
+    assert sweep.at(20).marginal_task == walk.number
+    assert sweep.at(30).marginal_task == feed.number
+    with pytest.raises(KeyError):
+        sweep.at(60)
+    with pytest.raises(ValueError):
+        sweep_budgets(owner, [30, -5])
+
+
+def test_small_budgets_do_not_cut_the_tail_short_for_larger_ones():
+    owner = Owner("Amelia", daily_time_available=0)
+    pet = Pet("Luna", "Dog")
+    meds = Task("Meds", 5, "high", time=480, pet_name="Luna")
+    walk = Task("Walk", 30, "medium", time=480, pet_name="Luna")
+    brush = Task("Brush", 5, "low", time=480, pet_name="Luna")
+    for task in (meds, walk, brush):
+        pet.add_task(task)
+    owner.add_pet(pet)
+
+    sweep = sweep_budgets(owner)
+
+    assert sweep.at(20)[1:] == (2, 10, walk.number)
+    assert sweep.at(30)[1:] == (2, 10, walk.number)
+    assert sweep.plan_at(20) == [meds, brush]